@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+# build.py가 생성하는 파일입니다. 수정은 build.py의 SPEC_CONTENT에서 하세요.
 
 
 a = Analysis(
@@ -6,13 +7,18 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['paramiko', 'paramiko.transport', 'paramiko.sftp', 'paramiko.sftp_client', 'paramiko.channel', 'paramiko.auth_handler', 'cryptography', 'cryptography.fernet', 'cryptography.hazmat.primitives', 'cryptography.hazmat.primitives.kdf.pbkdf2', 'cryptography.hazmat.primitives.hashes', 'cryptography.hazmat.backends', 'cryptography.hazmat.backends.openssl', 'bcrypt', 'nacl', 'nacl.bindings', 'rich', 'rich.console', 'rich.table', 'rich.panel', 'rich.prompt', 'rich.progress', 'rich.live', 'rich.layout', 'rich.text', 'rich.box', 'json', 'uuid', 'getpass', 'threading', 'queue'],
+    hiddenimports=['paramiko.transport', 'nacl.bindings'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['tkinter', 'unittest', 'test', 'pydoc_data', 'distutils', 'email.test'],
+    module_collection_mode={
+        'rich': 'pyz',
+        'paramiko': 'pyz',
+        'cryptography': 'pyz',
+    },
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
@@ -25,7 +31,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -38,7 +44,7 @@ coll = COLLECT(
     a.binaries,
     a.datas,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
     name='ssh_manager',
 )
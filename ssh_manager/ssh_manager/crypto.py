@@ -2,7 +2,7 @@
 암호화 모듈 - 서버 비밀번호를 안전하게 저장하기 위한 암호화/복호화 기능
 
 사용 방식:
-- Fernet 대칭키 암호화 사용 (AES-128-CBC)
+- AES-256-GCM 인증 암호화 사용 (이전 버전이 저장한 Fernet 암호문도 복호화 가능)
 - 마스터 비밀번호에서 키 파생 (PBKDF2HMAC)
 - 솔트를 사용하여 레인보우 테이블 공격 방지
 
@@ -17,19 +17,116 @@
 """
 
 import os
+import json
+import functools
+import time
 import base64
 from pathlib import Path
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
-from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hashes, hmac
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# rfernet (선택) - Rust로 구현된 Fernet, 설치되어 있으면 이전 형식 암호문 복호화에 사용
+# (토큰 형식이 같아 어느 쪽으로 만든 암호문이든 서로 복호화 가능)
+try:
+    import rfernet
+    RFERNET_AVAILABLE = True
+    _DECRYPT_ERRORS = (InvalidTag, InvalidToken, ValueError, rfernet.DecryptionError)
+except ImportError:
+    RFERNET_AVAILABLE = False
+    _DECRYPT_ERRORS = (InvalidTag, InvalidToken, ValueError)
+
+# AES-GCM 암호문 접두사 (없으면 이전 형식인 Fernet 토큰)
+# Fernet 토큰은 base64url이라 ':'가 들어갈 수 없으므로 두 형식이 겹치지 않음
+_GCM_PREFIX = "v2:"
+
+# AES-GCM nonce 길이 (바이트)
+_NONCE_SIZE = 12
+
+# PBKDF2로 파생한 키에서 AES-GCM 전용 키를 분리할 때 쓰는 HKDF info
+_GCM_KEY_INFO = b"ssh_manager aes-256-gcm"
+
+# 키 캐시 항목 이름을 만들 때 쓰는 프로세스별 무작위 비밀값
+# (캐시에 비밀번호의 단순 해시가 남지 않도록 HMAC으로 감쌈)
+_KEY_CACHE_SECRET = os.urandom(32)
+
+
+def _wipe(buffer: bytearray) -> None:
+    """비밀 값을 담았던 버퍼를 0으로 덮어쓰기"""
+    buffer[:] = bytes(len(buffer))
+
+
+def write_private_file(path: Path, data: bytes, exclusive: bool = False, sync: bool = False) -> None:
+    """
+    소유자만 읽기/쓰기 가능한 파일 쓰기 (생성 시점부터 0600 권한)
+    
+    이미 있던 파일을 덮어쓰는 경우에도 권한을 0600으로 맞춥니다.
+    (os.open의 mode는 새로 만들 때만 적용됨)
+    
+    Args:
+        path: 파일 경로
+        data: 쓸 내용
+        exclusive: True면 이미 있을 때 FileExistsError (덮어쓰지 않음)
+        sync: True면 닫기 전에 디스크에 기록 (fsync)
+    """
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+    flags |= os.O_EXCL if exclusive else os.O_TRUNC
+    fd = os.open(path, flags, 0o600)
+    if hasattr(os, 'fchmod'):
+        os.fchmod(fd, 0o600)
+    with open(fd, 'wb') as f:
+        f.write(data)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+@functools.lru_cache(maxsize=4)
+def _build_ciphers(key: bytes) -> tuple:
+    """
+    파생된 키로 암호화 객체 생성 (같은 키로 다시 initialize() 하면 재사용)
+    
+    Args:
+        key: base64로 인코딩된 32바이트 키
+        
+    Returns:
+        (AES-GCM 객체, 이전 형식용 Fernet 객체)
+    """
+    raw_key = base64.urlsafe_b64decode(key)
+    
+    # 새 암호문용 AES-256-GCM 키는 HKDF로 분리 (Fernet 키와 같은 키를 쓰지 않음)
+    gcm_key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=_GCM_KEY_INFO,
+    ).derive(raw_key)
+    
+    fernet = rfernet.Fernet(key.decode()) if RFERNET_AVAILABLE else Fernet(key)
+    return AESGCM(gcm_key), fernet
+
 
 class CryptoManager:
     """비밀번호 암호화/복호화 관리 클래스"""
     
     # 키 파생에 사용할 반복 횟수 (높을수록 무차별 대입 공격에 강함)
+    # .kdf 파일이 없는 기존 저장소의 값이자 자동 조정의 최솟값
     ITERATIONS = 480000
     
+    # 처음 실행 시 반복 횟수 자동 조정: 키 파생 목표 시간(초)과 반복 횟수 상한
+    KDF_TARGET_SECONDS = 0.35
+    MAX_ITERATIONS = 5000000
+    
+    # 자동 조정 때 속도 측정에 쓰는 반복 횟수
+    CALIBRATION_ITERATIONS = 50000
+    
+    # 파생된 키 캐시: HMAC(비밀값, 솔트 | 반복 횟수 | 마스터 비밀번호) → base64 키
+    # 같은 프로세스에서 같은 비밀번호로 다시 initialize() 할 때 PBKDF2 생략
+    _key_cache: dict[bytes, bytearray] = {}
+    
     def __init__(self, config_dir: Path):
         """
         Args:
@@ -37,6 +134,12 @@ class CryptoManager:
         """
         self.config_dir = config_dir
         self.salt_file = config_dir / ".salt"
+        self.kdf_file = config_dir / ".kdf"  # 키 파생 설정 (반복 횟수)
+        self._iterations = None
+        self._salt = None  # 처음 읽거나 만든 솔트 (재시도 때 파일 다시 읽지 않음)
+        self._aesgcm = None
+        
+        # 이전 형식(Fernet) 암호문 복호화용
         self._fernet = None
         
     def _get_or_create_salt(self) -> bytes:
@@ -48,18 +151,100 @@ class CryptoManager:
         - 같은 비밀번호도 다른 솔트와 결합하면 다른 키가 생성됨
         - 사전 계산된 해시 테이블(레인보우 테이블) 공격 방지
         """
-        if self.salt_file.exists():
-            return self.salt_file.read_bytes()
+        if self._salt is not None:
+            return self._salt
+        
+        try:
+            self._salt = self.salt_file.read_bytes()
+            return self._salt
+        except FileNotFoundError:
+            pass
         
         # 16바이트(128비트) 무작위 솔트 생성
         salt = os.urandom(16)
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.salt_file.write_bytes(salt)
         
-        # 솔트 파일 권한을 소유자만 읽기/쓰기로 제한 (보안)
-        self.salt_file.chmod(0o600)
+        # 솔트 파일은 소유자만 읽기/쓰기 권한으로 생성 (보안)
+        # 이미 있으면 덮어쓰지 않고 다른 프로세스가 먼저 만든 솔트 사용
+        try:
+            write_private_file(self.salt_file, salt, exclusive=True)
+        except FileExistsError:
+            self._salt = self.salt_file.read_bytes()
+            return self._salt
+        
+        # 새 저장소는 이 컴퓨터 속도에 맞춘 반복 횟수 사용
+        # (솔트를 만든 뒤 기록: 중간에 중단되면 .kdf 없이 기본 반복 횟수로 일관되게 동작)
+        # .kdf 기록이 성공한 뒤에만 반영 (실패 시 메모리와 디스크의 반복 횟수가 달라지지 않게)
+        iterations = self._calibrate_iterations()
+        write_private_file(self.kdf_file, json.dumps({'iterations': iterations}).encode())
+        self._iterations = iterations
+        
+        self._salt = salt
         return salt
     
+    def _calibrate_iterations(self) -> int:
+        """
+        키 파생이 약 KDF_TARGET_SECONDS 걸리도록 반복 횟수 계산
+        
+        구현 방식:
+        - CALIBRATION_ITERATIONS 만큼 PBKDF2를 실행해 초당 반복 횟수 측정
+        - 결과는 ITERATIONS ~ MAX_ITERATIONS 범위로 제한 (느린 컴퓨터라도 기존보다 약해지지 않음)
+        
+        Returns:
+            사용할 반복 횟수
+        """
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=os.urandom(16),
+            iterations=self.CALIBRATION_ITERATIONS,
+        )
+        start = time.perf_counter()
+        kdf.derive(b'calibration')
+        elapsed = max(time.perf_counter() - start, 1e-6)
+        
+        iterations = int(self.CALIBRATION_ITERATIONS * self.KDF_TARGET_SECONDS / elapsed)
+        return max(self.ITERATIONS, min(iterations, self.MAX_ITERATIONS))
+    
+    def _get_iterations(self) -> int:
+        """
+        저장소의 키 파생 반복 횟수 (.kdf 파일이 없으면 ITERATIONS)
+        
+        파일이 손상되었으면 다른 반복 횟수로 대신하지 않고 오류를 냅니다.
+        (다른 값으로 파생하면 키가 달라져 비밀번호가 틀린 것처럼 보임)
+        
+        Raises:
+            ValueError: .kdf 파일 내용이 올바르지 않은 경우
+        """
+        if self._iterations is None:
+            try:
+                data = self.kdf_file.read_bytes()
+            except FileNotFoundError:
+                self._iterations = self.ITERATIONS
+                return self._iterations
+            
+            try:
+                iterations = json.loads(data)['iterations']
+            except (ValueError, KeyError, TypeError):
+                iterations = None
+            if type(iterations) is not int or iterations <= 0:
+                raise ValueError(f"키 파생 설정 파일이 손상되었습니다: {self.kdf_file}")
+            self._iterations = iterations
+        return self._iterations
+    
+    def check_kdf_file(self) -> tuple[bool, str]:
+        """
+        키 파생 설정(.kdf) 파일 확인 (마스터 비밀번호 입력 전에 호출)
+        
+        Returns:
+            (정상 여부, 오류 메시지)
+        """
+        try:
+            self._get_iterations()
+            return True, ""
+        except (OSError, ValueError) as e:
+            return False, str(e)
+    
     def _derive_key(self, master_password: str) -> bytes:
         """
         마스터 비밀번호에서 암호화 키 파생
@@ -76,18 +261,49 @@ class CryptoManager:
             32바이트 암호화 키 (base64 인코딩됨)
         """
         salt = self._get_or_create_salt()
+        iterations = self._get_iterations()
         
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,  # Fernet은 32바이트 키 필요
-            salt=salt,
-            iterations=self.ITERATIONS,
-        )
-        
-        # Fernet은 base64로 인코딩된 키 필요
-        key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
+        # 비밀번호 바이트는 지울 수 있는 버퍼 하나에 담아 캐시 키 계산과 키 파생에 함께 쓰고 0으로 덮어씀
+        # (.encode()로 불변 bytes 사본을 따로 만들지 않음, 원본 str은 파이썬에서 지울 수 없음)
+        password = bytearray(master_password, 'utf-8')
+        try:
+            mac = hmac.HMAC(_KEY_CACHE_SECRET, hashes.SHA256())
+            mac.update(salt + b'|' + str(iterations).encode() + b'|')
+            mac.update(password)
+            cache_key = mac.finalize()
+            
+            cached = CryptoManager._key_cache.get(cache_key)
+            if cached is not None:
+                return bytes(cached)
+            
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,  # 32바이트 키 (Fernet 키, AES-GCM 키 파생의 입력)
+                salt=salt,
+                iterations=iterations,
+            )
+            
+            # Fernet은 base64로 인코딩된 키 필요
+            key = base64.urlsafe_b64encode(kdf.derive(password))
+        finally:
+            _wipe(password)
+        CryptoManager._key_cache[cache_key] = bytearray(key)
         return key
     
+    @classmethod
+    def clear_key_cache(cls) -> None:
+        """파생된 키 캐시를 0으로 덮어쓴 뒤 비움 (키로 만든 암호화 객체 캐시도 비움)"""
+        for key in cls._key_cache.values():
+            _wipe(key)
+        cls._key_cache.clear()
+        _build_ciphers.cache_clear()
+    
+    def close(self) -> None:
+        """암호화 시스템 정리 (키 캐시 삭제, 초기화 해제)"""
+        self.clear_key_cache()
+        self._aesgcm = None
+        self._fernet = None
+    
     def initialize(self, master_password: str) -> bool:
         """
         마스터 비밀번호로 암호화 시스템 초기화
@@ -100,7 +316,7 @@ class CryptoManager:
         """
         try:
             key = self._derive_key(master_password)
-            self._fernet = Fernet(key)
+            self._aesgcm, self._fernet = _build_ciphers(key)
             return True
         except Exception:
             return False
@@ -109,49 +325,126 @@ class CryptoManager:
         """
         문자열 암호화
         
-        Fernet 암호화 특징:
-        - 타임스탬프 포함 (TTL 검증 가능)
-        - HMAC으로 무결성 검증
-        - IV(초기화 벡터) 자동 생성
+        AES-GCM 암호화 특징:
+        - 인증 태그로 무결성 검증 (변조되면 복호화 실패)
+        - 호출마다 무작위 12바이트 nonce 생성
+        - AES-NI 등 하드웨어 가속을 한 번의 호출로 사용
         
         Args:
             plaintext: 암호화할 평문
             
         Returns:
-            base64로 인코딩된 암호문
+            "v2:" + base64(nonce + 암호문 + 태그)
         """
-        if not self._fernet:
+        if not self._aesgcm:
             raise RuntimeError("암호화 시스템이 초기화되지 않았습니다. initialize()를 먼저 호출하세요.")
         
-        encrypted = self._fernet.encrypt(plaintext.encode())
-        return encrypted.decode()
+        return self._seal(os.urandom(_NONCE_SIZE), plaintext)
+    
+    def encrypt_many(self, plaintexts: list[str]) -> list[str]:
+        """
+        여러 문자열을 한 번에 암호화
+        
+        구현 방식:
+        - 결과는 encrypt()와 같은 형식 (decrypt로 그대로 복호화 가능)
+        - nonce는 os.urandom 한 번으로 전부 만들어 나눠 씀
+        - 항목마다 nonce가 다르므로 같은 평문도 서로 다른 암호문이 됨
+        
+        Args:
+            plaintexts: 암호화할 평문 목록
+            
+        Returns:
+            입력과 같은 순서의 암호문 목록
+        """
+        if not self._aesgcm:
+            raise RuntimeError("암호화 시스템이 초기화되지 않았습니다. initialize()를 먼저 호출하세요.")
+        
+        nonces = os.urandom(_NONCE_SIZE * len(plaintexts))
+        return [
+            self._seal(nonces[i * _NONCE_SIZE:(i + 1) * _NONCE_SIZE], plaintext)
+            for i, plaintext in enumerate(plaintexts)
+        ]
+    
+    def _seal(self, nonce: bytes, plaintext: str) -> str:
+        """주어진 nonce로 AES-GCM 암호화하여 저장 형식 문자열로 변환"""
+        data = bytearray(plaintext, 'utf-8')  # 불변 bytes 사본 없이 지울 수 있는 버퍼로 변환
+        try:
+            encrypted = self._aesgcm.encrypt(nonce, data, None)
+        finally:
+            _wipe(data)  # 평문 바이트 정리
+        return _GCM_PREFIX + base64.urlsafe_b64encode(nonce + encrypted).decode()
+    
+    def _open(self, ciphertext: str) -> bytes:
+        """
+        저장 형식 문자열 복호화 (AES-GCM 또는 이전 형식 Fernet)
+        
+        Raises:
+            _DECRYPT_ERRORS 중 하나: 키가 틀리거나 데이터가 손상된 경우
+        """
+        if ciphertext.startswith(_GCM_PREFIX):
+            data = base64.urlsafe_b64decode(ciphertext[len(_GCM_PREFIX):])
+            return self._aesgcm.decrypt(data[:_NONCE_SIZE], data[_NONCE_SIZE:], None)
+        return self._fernet.decrypt(ciphertext)
+    
+    @staticmethod
+    def is_legacy(ciphertext: str) -> bool:
+        """이전 형식(Fernet) 암호문 여부 (다시 암호화해서 저장할 대상)"""
+        return not ciphertext.startswith(_GCM_PREFIX)
     
     def decrypt(self, ciphertext: str) -> str:
         """
         암호문 복호화
         
         Args:
-            ciphertext: base64로 인코딩된 암호문
+            ciphertext: encrypt()의 결과 또는 이전 버전이 저장한 Fernet 토큰
             
         Returns:
             복호화된 평문
             
         Raises:
-            InvalidToken: 잘못된 암호문이거나 키가 틀린 경우
+            ValueError: 잘못된 암호문이거나 키가 틀린 경우
         """
-        if not self._fernet:
+        if not self._aesgcm:
             raise RuntimeError("암호화 시스템이 초기화되지 않았습니다. initialize()를 먼저 호출하세요.")
         
         try:
-            decrypted = self._fernet.decrypt(ciphertext.encode())
-            return decrypted.decode()
-        except InvalidToken:
+            return self._open(ciphertext).decode()
+        except _DECRYPT_ERRORS:
+            raise ValueError("복호화 실패: 마스터 비밀번호가 틀리거나 데이터가 손상되었습니다.")
+    
+    def decrypt_many(self, ciphertexts: list[str]) -> list[str]:
+        """
+        여러 암호문을 한 번에 복호화 (서버 목록 로드용)
+        
+        구현 방식:
+        - 초기화 확인과 예외 변환은 한 번만 하고 항목별 복호화를 직접 반복 호출
+        
+        Args:
+            ciphertexts: 암호문 목록
+            
+        Returns:
+            입력과 같은 순서의 평문 목록
+            
+        Raises:
+            ValueError: 하나라도 복호화에 실패한 경우
+        """
+        if not self._aesgcm:
+            raise RuntimeError("암호화 시스템이 초기화되지 않았습니다. initialize()를 먼저 호출하세요.")
+        
+        open_ = self._open
+        try:
+            return [open_(ciphertext).decode() for ciphertext in ciphertexts]
+        except _DECRYPT_ERRORS:
             raise ValueError("복호화 실패: 마스터 비밀번호가 틀리거나 데이터가 손상되었습니다.")
     
     def verify_password(self, test_data: str = None) -> bool:
         """
         마스터 비밀번호 검증
         
+        구현 방식:
+        - AES-GCM 암호문은 태그 확인, 이전 형식(Fernet)은 HMAC 확인이 복호화와 함께 이루어짐
+        - 토큰을 직접 해석하지 않고 라이브러리의 복호화 결과로만 판단
+        
         Args:
             test_data: 테스트용 암호화된 데이터
             
@@ -159,18 +452,21 @@ class CryptoManager:
             비밀번호 일치 여부
         """
         if not test_data:
-            return self._fernet is not None
+            return self._aesgcm is not None
+        
+        if not self._aesgcm:
+            return False
         
         try:
-            self.decrypt(test_data)
+            self._open(test_data)
             return True
-        except (ValueError, RuntimeError):
+        except _DECRYPT_ERRORS:
             return False
     
     @property
     def is_initialized(self) -> bool:
         """암호화 시스템 초기화 여부"""
-        return self._fernet is not None
+        return self._aesgcm is not None
     
     def is_first_run(self) -> bool:
         """처음 실행 여부 (솔트 파일 존재 확인)"""
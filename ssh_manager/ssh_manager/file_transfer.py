@@ -10,19 +10,63 @@ SFTP vs SCP:
 - SFTP: SSH 서브시스템, 더 많은 기능 (디렉토리 작업, 권한 설정 등)
 - SCP: 단순 파일 복사, 약간 빠름
 - 여기서는 SFTP 사용 (paramiko 기본 지원, 더 유연함)
+
+전송 속도 튜닝:
+- SSHClient 대신 Transport를 직접 생성하여 채널 윈도우를 크게 설정
+  (기본 2MB 윈도우는 RTT가 큰 환경에서 윈도우 갱신 대기로 처리량이 제한됨)
+- 업로드는 pipelined 모드로 쓰기 요청을 응답 대기 없이 연속 전송
+- 다운로드는 prefetch로 읽기 요청을 미리 보내 왕복 대기 제거
 """
 
+import fnmatch
+import glob
+import mmap
 import os
+import shlex
+import shutil
+import socket
+import stat
+import tarfile
+import tempfile
 import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
-from queue import Queue, Empty
+from time import monotonic
+from types import SimpleNamespace
+from typing import Callable, Iterator, Optional
 
 import paramiko
-from paramiko import SFTPClient, SSHClient, AutoAddPolicy
+from paramiko import SFTPClient
 
 from .server import Server
+from .ssh_client import prefer_fast_ciphers
+
+
+# SSH 채널 윈도우 크기 (paramiko 기본 2MB -> 최대값)
+TRANSFER_WINDOW_SIZE = 2**31 - 1
+
+# SFTP 읽기/쓰기 요청 1개의 크기 (paramiko 기본 32KB)
+# - 요청이 클수록 패킷/암호화/응답 처리 횟수 감소
+# - OpenSSH sftp-server는 메시지 최대 256KB로 제한하므로 헤더 여유를 두고 255KB 사용
+TRANSFER_CHUNK_SIZE = 255 * 1024
+
+# 다운로드 시 동시에 보내 두는 읽기 요청 수 (32 x 255KB = 약 8MB가 항상 전송 중)
+TRANSFER_MAX_REQUESTS = 32
+
+# 압축 효과가 큰 텍스트 계열 확장자 (원격 서버 업로드 시 zlib 압축 사용)
+COMPRESSIBLE_EXTENSIONS = frozenset({
+    '.txt', '.log', '.json', '.yaml', '.yml', '.sql', '.csv', '.xml',
+    '.py', '.c', '.cpp', '.h',
+})
+
+# 로컬 경로 구분자가 '/'가 아닌 환경(Windows)에서만 원격 경로 변환
+_SEP_REPLACE = os.sep != '/'
+
+# 압축 이득이 없는 로컬 호스트 주소
+LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '::1'})
 
 
 @dataclass
@@ -55,56 +99,182 @@ class TransferResult:
         return 0.0
 
 
+# 캐시된 Transport의 keepalive 간격 (초)
+# 메뉴에서 대기하는 동안 NAT/방화벽이 유휴 연결을 끊지 않도록 주기적으로 패킷 전송
+TRANSPORT_KEEPALIVE = 30
+
+# 서버별 인증된 Transport 캐시 (키: (host, port, username))
+# SSH는 하나의 연결 위에 여러 채널을 다중화할 수 있으므로
+# 같은 서버로 향하는 SFTP 세션들이 Transport 하나를 공유합니다.
+_transport_cache: dict[tuple[str, int, str, bool], paramiko.Transport] = {}
+_transport_locks: dict[tuple[str, int, str, bool], threading.Lock] = {}
+_transport_cache_lock = threading.Lock()
+
+
+def _open_transport(server: Server, timeout: int, compress: bool = False) -> paramiko.Transport:
+    """
+    새 SSH Transport 생성 및 인증
+    
+    구현 방식:
+    - TCP 소켓을 직접 열고 TCP_NODELAY 설정 (작은 SFTP 요청 지연 방지)
+    - Transport 기본 윈도우를 크게 잡아 윈도우 갱신 대기 제거
+    - 암호(AES-GCM 우선)와 압축 여부는 핸드셰이크에서 협상되므로 connect 전에 설정
+    - 호스트 키는 검증하지 않음 (기존 AutoAddPolicy와 동일한 동작)
+    - 캐시에 남아 재사용되므로 keepalive 설정 (유휴 연결이 중간 장비에서 끊기지 않게)
+    """
+    sock = socket.create_connection((server.host, server.port), timeout=timeout)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    transport = paramiko.Transport(sock)
+    try:
+        transport.default_window_size = TRANSFER_WINDOW_SIZE
+        transport.banner_timeout = timeout
+        prefer_fast_ciphers(transport)
+        transport.use_compression(compress)
+        transport.connect(username=server.username, password=server.password)
+        transport.set_keepalive(TRANSPORT_KEEPALIVE)
+    except Exception:
+        transport.close()
+        raise
+    return transport
+
+
+def _get_transport(server: Server, timeout: int, compress: bool = False) -> paramiko.Transport:
+    """
+    캐시된 Transport 반환 (없거나 끊겼으면 새로 연결)
+    
+    같은 서버에 여러 스트림이 동시에 연결해도 핸드셰이크는 한 번만 하도록
+    서버별 잠금 안에서 생성합니다. (압축 여부가 다르면 별도 Transport)
+    """
+    key = (server.host, server.port, server.username, compress)
+    with _transport_cache_lock:
+        key_lock = _transport_locks.setdefault(key, threading.Lock())
+    
+    with key_lock:
+        transport = _transport_cache.get(key)
+        if transport is not None and transport.is_active():
+            return transport
+        
+        transport = _open_transport(server, timeout, compress)
+        _transport_cache[key] = transport
+        return transport
+
+
+def _discard_transport(server: Server, compress: bool, transport: paramiko.Transport) -> None:
+    """캐시에서 Transport 제거 후 종료 (끊긴 연결을 다시 쓰지 않도록)"""
+    key = (server.host, server.port, server.username, compress)
+    with _transport_cache_lock:
+        key_lock = _transport_locks.setdefault(key, threading.Lock())
+    
+    with key_lock:
+        if _transport_cache.get(key) is transport:
+            del _transport_cache[key]
+    
+    try:
+        transport.close()
+    except Exception:
+        pass
+
+
+def close_cached_transports() -> None:
+    """캐시된 모든 Transport 종료 (프로그램 종료/연결 해제 시 호출)"""
+    with _transport_cache_lock:
+        transports = list(_transport_cache.values())
+        _transport_cache.clear()
+    
+    for transport in transports:
+        try:
+            transport.close()
+        except Exception:
+            pass
+
+
 class SFTPTransfer:
     """단일 서버 SFTP 전송 클래스"""
     
-    def __init__(self, server: Server, timeout: int = 30):
+    def __init__(
+        self,
+        server: Server,
+        timeout: int = 30,
+        chunk_size: int = TRANSFER_CHUNK_SIZE,
+        compress: bool = False
+    ):
+        """
+        Args:
+            server: 대상 서버
+            timeout: 연결 타임아웃 (초)
+            chunk_size: SFTP 요청 1개의 크기 (바이트)
+            compress: SSH zlib 압축 사용 여부 (느린 회선 + 텍스트 파일에 유리)
+        """
         self.server = server
         self.timeout = timeout
-        self._ssh_client: Optional[SSHClient] = None
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self._transport: Optional[paramiko.Transport] = None
         self._sftp_client: Optional[SFTPClient] = None
+        self._known_dirs: set[str] = set()  # 이미 확인한 원격 디렉토리
     
     def connect(self) -> tuple[bool, str]:
-        """SFTP 연결 수립"""
+        """
+        SFTP 연결 수립
+        
+        같은 서버의 인증된 Transport가 캐시에 있으면 그 위에 SFTP 채널만 새로 엽니다.
+        (TCP 연결 + 키 교환 + 인증 왕복 없이 채널 열기 1회로 끝남)
+        
+        캐시된 연결이 중간 장비에서 끊겨 채널을 열 수 없으면 캐시에서 버리고 한 번만 새로 연결합니다.
+        """
         try:
-            self._ssh_client = SSHClient()
-            self._ssh_client.set_missing_host_key_policy(AutoAddPolicy())
-            
-            self._ssh_client.connect(
-                hostname=self.server.host,
-                port=self.server.port,
-                username=self.server.username,
-                password=self.server.password,
-                timeout=self.timeout,
-                allow_agent=False,
-                look_for_keys=False,
-            )
-            
-            # SFTP 세션 열기
-            self._sftp_client = self._ssh_client.open_sftp()
+            self._transport = _get_transport(self.server, self.timeout, self.compress)
+            try:
+                self._sftp_client = self._open_sftp(self._transport)
+            except Exception:
+                _discard_transport(self.server, self.compress, self._transport)
+                self._transport = _get_transport(self.server, self.timeout, self.compress)
+                self._sftp_client = self._open_sftp(self._transport)
             return True, ""
             
         except Exception as e:
+            self.disconnect()
             return False, str(e)
     
+    def _open_sftp(self, transport: paramiko.Transport) -> SFTPClient:
+        """
+        Transport 위에 SFTP 세션 열기 (SFTPClient.from_transport와 동일)
+        
+        채널 열기 응답을 self.timeout까지만 기다립니다.
+        (from_transport는 제한 없이 기다려 끊긴 연결에서 오래 멈출 수 있음)
+        """
+        channel = transport.open_session(window_size=TRANSFER_WINDOW_SIZE, timeout=self.timeout)
+        try:
+            channel.invoke_subsystem('sftp')
+            return SFTPClient(channel)
+        except Exception:
+            channel.close()
+            raise
+    
     def disconnect(self) -> None:
-        """연결 종료"""
+        """
+        연결 종료
+        
+        SFTP 채널만 닫고 Transport는 다른 전송에서 재사용하도록 남겨 둡니다.
+        (close_cached_transports()로 일괄 종료)
+        """
         try:
             if self._sftp_client:
                 self._sftp_client.close()
-            if self._ssh_client:
-                self._ssh_client.close()
         except Exception:
             pass
         finally:
             self._sftp_client = None
-            self._ssh_client = None
+            self._transport = None
+            self._known_dirs.clear()
     
     def upload(
         self, 
         local_path: str, 
         remote_path: str,
-        progress_callback: Callable[[TransferProgress], None] = None
+        progress_callback: Callable[[TransferProgress], None] = None,
+        file_size: int = None
     ) -> TransferResult:
         """
         파일 업로드
@@ -113,12 +283,12 @@ class SFTPTransfer:
             local_path: 로컬 파일 경로
             remote_path: 원격 저장 경로
             progress_callback: 진행률 콜백
+            file_size: 이미 알고 있는 로컬 파일 크기 (없으면 stat으로 확인)
             
         Returns:
             전송 결과
         """
-        import time
-        start_time = time.time()
+        start_time = monotonic()
         
         if not self._sftp_client:
             success, error = self.connect()
@@ -133,57 +303,51 @@ class SFTPTransfer:
         
         try:
             local_file = Path(local_path)
-            if not local_file.exists():
-                return TransferResult(
-                    server=self.server,
-                    local_path=local_path,
-                    remote_path=remote_path,
-                    success=False,
-                    error_message=f"로컬 파일을 찾을 수 없습니다: {local_path}"
-                )
-            
-            file_size = local_file.stat().st_size
-            transferred = [0]  # 리스트로 감싸서 클로저에서 수정 가능하게
-            last_time = [start_time]
+            if file_size is None:
+                try:
+                    file_size = os.stat(local_path).st_size
+                except FileNotFoundError:
+                    return TransferResult(
+                        server=self.server,
+                        local_path=local_path,
+                        remote_path=remote_path,
+                        success=False,
+                        error_message=f"로컬 파일을 찾을 수 없습니다: {local_path}"
+                    )
             
             # 원격 경로가 디렉토리면 파일명 자동 추가
             if remote_path.endswith('/'):
                 remote_path = remote_path + local_file.name
             
-            def callback(current: int, total: int):
-                """paramiko SFTP 콜백"""
-                transferred[0] = current
-                current_time = time.time()
-                elapsed = current_time - last_time[0]
-                
-                if progress_callback and elapsed > 0.1:  # 100ms마다 업데이트
-                    speed = current / (current_time - start_time) if current_time > start_time else 0
-                    progress = TransferProgress(
-                        server=self.server,
-                        filename=local_file.name,
-                        transferred=current,
-                        total=total,
-                        percentage=(current / total * 100) if total > 0 else 0,
-                        speed=speed
-                    )
-                    progress_callback(progress)
-                    last_time[0] = current_time
+            callback = self._make_progress_callback(
+                local_file.name, file_size, start_time, progress_callback
+            )
             
             # 원격 디렉토리 생성 (필요한 경우)
             remote_dir = str(Path(remote_path).parent)
             self._mkdir_p(remote_dir)
             
-            # 파일 업로드
-            self._sftp_client.put(local_path, remote_path, callback=callback)
+            # 파일 업로드 (pipelined: 쓰기 응답을 기다리지 않고 연속 전송)
+            # bufsize=0: BufferedFile 내부 버퍼를 거치지 않고 조각을 바로 쓰기 요청으로 보냄
+            with open(local_path, 'rb') as local_fh, \
+                    self._sftp_client.open(remote_path, 'wb', bufsize=0) as remote_fh:
+                remote_fh.MAX_REQUEST_SIZE = self.chunk_size
+                remote_fh.set_pipelined(True)
+                sent = self._send_file(local_fh, remote_fh, file_size, callback)
             
-            elapsed = time.time() - start_time
+            # 전송 크기 확인 (SFTPClient.put의 confirm과 동일)
+            remote_size = self._sftp_client.stat(remote_path).st_size
+            if remote_size != sent:
+                raise IOError(f"전송 크기 불일치: {remote_size} != {sent}")
+            
+            elapsed = monotonic() - start_time
             
             return TransferResult(
                 server=self.server,
                 local_path=local_path,
                 remote_path=remote_path,
                 success=True,
-                transferred_bytes=file_size,
+                transferred_bytes=sent,
                 elapsed_time=elapsed
             )
             
@@ -194,7 +358,7 @@ class SFTPTransfer:
                 remote_path=remote_path,
                 success=False,
                 error_message=str(e),
-                elapsed_time=time.time() - start_time
+                elapsed_time=monotonic() - start_time
             )
     
     def download(
@@ -211,8 +375,7 @@ class SFTPTransfer:
             local_path: 로컬 저장 경로
             progress_callback: 진행률 콜백
         """
-        import time
-        start_time = time.time()
+        start_time = monotonic()
         
         if not self._sftp_client:
             success, error = self.connect()
@@ -230,35 +393,18 @@ class SFTPTransfer:
             file_stat = self._sftp_client.stat(remote_path)
             file_size = file_stat.st_size
             
-            transferred = [0]
-            last_time = [start_time]
-            
-            def callback(current: int, total: int):
-                transferred[0] = current
-                current_time = time.time()
-                elapsed = current_time - last_time[0]
-                
-                if progress_callback and elapsed > 0.1:
-                    speed = current / (current_time - start_time) if current_time > start_time else 0
-                    progress = TransferProgress(
-                        server=self.server,
-                        filename=Path(remote_path).name,
-                        transferred=current,
-                        total=total,
-                        percentage=(current / total * 100) if total > 0 else 0,
-                        speed=speed
-                    )
-                    progress_callback(progress)
-                    last_time[0] = current_time
+            callback = self._make_progress_callback(
+                Path(remote_path).name, file_size, start_time, progress_callback
+            )
             
             # 로컬 디렉토리 생성
             local_dir = Path(local_path).parent
             local_dir.mkdir(parents=True, exist_ok=True)
             
             # 파일 다운로드
-            self._sftp_client.get(remote_path, local_path, callback=callback)
+            self._fetch_file(remote_path, local_path, file_size, callback)
             
-            elapsed = time.time() - start_time
+            elapsed = monotonic() - start_time
             
             return TransferResult(
                 server=self.server,
@@ -276,7 +422,7 @@ class SFTPTransfer:
                 remote_path=remote_path,
                 success=False,
                 error_message=f"원격 파일을 찾을 수 없습니다: {remote_path}",
-                elapsed_time=time.time() - start_time
+                elapsed_time=monotonic() - start_time
             )
         except Exception as e:
             return TransferResult(
@@ -285,7 +431,7 @@ class SFTPTransfer:
                 remote_path=remote_path,
                 success=False,
                 error_message=str(e),
-                elapsed_time=time.time() - start_time
+                elapsed_time=monotonic() - start_time
             )
     
     def upload_directory(
@@ -297,6 +443,13 @@ class SFTPTransfer:
         """
         폴더 전체 업로드 (재귀적)
         
+        구현 방식:
+        - 단일 파일이면 upload()로 바로 전송
+        - 실제 폴더면 먼저 tar 스트림 1개로 전송 시도 (_upload_tar)
+          (채널 1개, 원격 프로세스 1개로 끝나 파일마다 open/close 왕복이 없음)
+        - 와일드카드 패턴이거나, 원격에 tar가 없거나 exec가 막힌 서버면
+          파일별 SFTP 업로드로 처리
+        
         Args:
             local_dir: 로컬 폴더 경로
             remote_dir: 원격 폴더 경로
@@ -305,84 +458,310 @@ class SFTPTransfer:
         Returns:
             각 파일의 전송 결과 리스트
         """
-        import glob
-        
-        results = []
-        local_path = Path(local_dir)
-        
-        if not local_path.exists():
-            return [TransferResult(
-                server=self.server,
-                local_path=local_dir,
-                remote_path=remote_dir,
-                success=False,
-                error_message=f"로컬 경로를 찾을 수 없습니다: {local_dir}"
-            )]
-        
-        # 와일드카드 패턴 처리 (예: /path/*.txt, /path/*)
-        if '*' in local_dir:
-            files = glob.glob(local_dir, recursive=True)
-            base_dir = str(Path(local_dir.split('*')[0]).parent)
-        elif local_path.is_file():
+        is_pattern = '*' in local_dir
+        if not is_pattern and os.path.isfile(local_dir):
             # 단일 파일
             return [self.upload(local_dir, remote_dir, progress_callback)]
-        else:
-            # 폴더 전체
-            files = []
-            for f in local_path.rglob('*'):
-                if f.is_file():
-                    files.append(str(f))
-            base_dir = str(local_path)
-        
-        if not files:
+        
+        plan, error = _build_upload_plan(local_dir, remote_dir)
+        if error:
             return [TransferResult(
                 server=self.server,
                 local_path=local_dir,
                 remote_path=remote_dir,
                 success=False,
-                error_message="전송할 파일이 없습니다."
+                error_message=error
             )]
         
+        if not self._sftp_client:
+            success, error = self.connect()
+            if not success:
+                return [
+                    TransferResult(
+                        server=self.server,
+                        local_path=local_file,
+                        remote_path=remote_file,
+                        success=False,
+                        error_message=error
+                    )
+                    for local_file, remote_file, _ in plan
+                ]
+        
+        # tar는 실제 폴더일 때만 사용 (패턴은 파일별 경로가 제각각이라 SFTP로 처리)
+        if not is_pattern and os.path.isdir(local_dir):
+            results = self._upload_tar(plan, remote_dir, progress_callback)
+            if results is not None:
+                return results
+        
+        # 필요한 원격 디렉토리를 먼저 한 번에 생성 (상위 경로부터)
+        for parent in sorted({str(Path(remote_file).parent) for _, remote_file, _ in plan}):
+            self._mkdir_p(parent)
+        
         # 각 파일 업로드
-        for local_file in files:
-            # 상대 경로 계산
-            rel_path = os.path.relpath(local_file, base_dir)
-            remote_file = os.path.join(remote_dir, rel_path).replace('\\', '/')
+        return [
+            self.upload(local_file, remote_file, progress_callback, file_size)
+            for local_file, remote_file, file_size in plan
+        ]
+    
+    def _upload_tar(
+        self,
+        plan: list[tuple[str, str, Optional[int]]],
+        remote_dir: str,
+        progress_callback: Callable[[TransferProgress], None] = None
+    ) -> Optional[list[TransferResult]]:
+        """
+        전송 목록을 tar 스트림으로 묶어 exec 채널 하나로 업로드
+        
+        구현 방식:
+        - 원격에서 'mkdir -p && tar -xf -' 실행 후 stdin으로 tar 스트림 전송
+        - --no-same-owner: root로 풀어도 로컬 uid/gid를 원격 파일에 적용하지 않음
+        - 로컬에서는 tarfile 스트림 모드('w|')로 파일을 순서대로 기록 (임시 파일 없음)
+        - 원격 종료 코드가 0이 아니면 None을 반환하여 SFTP 방식으로 대체
+        
+        Args:
+            plan: (로컬 파일, 원격 파일, 파일 크기) 목록
+            remote_dir: 원격 폴더 경로 (tar 압축 해제 위치)
+            progress_callback: 진행률 콜백
+            
+        Returns:
+            각 파일의 전송 결과 리스트, tar 전송을 쓸 수 없으면 None
+        """
+        start_time = monotonic()
+        
+        total = sum(file_size or 0 for _, _, file_size in plan)
+        callback = self._make_progress_callback(
+            Path(remote_dir).name, total, start_time, progress_callback
+        )
+        quoted_dir = shlex.quote(remote_dir)
+        command = f"mkdir -p {quoted_dir} && tar --no-same-owner -xf - -C {quoted_dir}"
+        
+        channel = None
+        try:
+            channel = self._transport.open_session(window_size=TRANSFER_WINDOW_SIZE)
+            channel.exec_command(command)
             
-            result = self.upload(local_file, remote_file, progress_callback)
-            results.append(result)
+            sent = 0
+            # tarfile은 write만 호출하므로 ChannelFile 대신 sendall을 바로 연결
+            # (TarFile과 TarInfo의 순환 참조로 ChannelFile이 종료 시점까지 남아
+            #  이미 닫힌 버퍼를 다시 flush하려는 경고가 나지 않도록 함)
+            stream = SimpleNamespace(write=channel.sendall)
+            with tarfile.open(fileobj=stream, mode='w|', dereference=True,
+                              bufsize=TRANSFER_CHUNK_SIZE) as tar:
+                for local_file, remote_file, file_size in plan:
+                    # 원격 경로에서 remote_dir 이후 부분을 tar 내부 경로로 사용
+                    tar.add(local_file, arcname=remote_file[len(remote_dir):].lstrip('/'))
+                    sent += file_size or 0
+                    if callback:
+                        callback(sent, total)
+            
+            channel.shutdown_write()
+            if channel.recv_exit_status() != 0:
+                return None
+        except Exception:
+            return None  # exec 거부, tar 없음, 전송 중 채널 종료 등
+        finally:
+            if channel is not None:
+                channel.close()
         
-        return results
+        elapsed = monotonic() - start_time
+        return [
+            TransferResult(
+                server=self.server,
+                local_path=local_file,
+                remote_path=remote_file,
+                success=True,
+                transferred_bytes=file_size or 0,
+                elapsed_time=elapsed
+            )
+            for local_file, remote_file, file_size in plan
+        ]
+    
+    def _make_progress_callback(
+        self,
+        filename: str,
+        file_size: int,
+        start_time: float,
+        progress_callback: Optional[Callable[[TransferProgress], None]]
+    ) -> Optional[Callable[[int, int], None]]:
+        """
+        paramiko 형식 진행률 콜백 생성 (100ms 간격으로 progress_callback 호출)
+        
+        구현 방식:
+        - 청크마다 호출되므로 경과 시간부터 확인하고 대부분 즉시 반환
+        - 전송당 TransferProgress 하나를 만들어 두고 값만 갱신해서 전달
+        - monotonic() 사용 (시스템 시계 변경에 영향받지 않음)
+        
+        Args:
+            filename: 진행률에 표시할 파일명
+            file_size: 전체 크기
+            start_time: 전송 시작 시각 (monotonic 기준)
+            progress_callback: 사용자 콜백, 없으면 None
+            
+        Returns:
+            청크 콜백, progress_callback이 없으면 None
+        """
+        if progress_callback is None:
+            return None
+        
+        progress = TransferProgress(
+            server=self.server,
+            filename=filename,
+            transferred=0,
+            total=file_size,
+            percentage=0.0,
+            speed=0.0
+        )
+        last_time = [start_time]
+        
+        def callback(current: int, total: int):
+            """paramiko SFTP 콜백"""
+            now = monotonic()
+            if now - last_time[0] < 0.1:  # 100ms마다 업데이트
+                return
+            last_time[0] = now
+            
+            progress.transferred = current
+            progress.total = total
+            progress.percentage = (current / total * 100) if total > 0 else 0
+            progress.speed = current / (now - start_time)
+            progress_callback(progress)
+        
+        return callback
+    
+    def _fetch_file(
+        self,
+        remote_path: str,
+        local_path: str,
+        file_size: int,
+        callback: Callable[[int, int], None] = None
+    ) -> None:
+        """
+        원격 파일을 로컬로 복사 (fastGet 방식)
+        
+        구현 방식:
+        - prefetch로 여러 읽기 요청을 동시에 보내 두고 도착 순서대로 기록
+        - 요청 1개씩 응답을 기다리는 순차 읽기 대비 RTT 영향이 거의 없음
+        - 동시 요청 수를 제한하여 대용량 파일에서도 버퍼 메모리 일정 유지
+        """
+        with self._sftp_client.open(remote_path, 'rb') as remote_fh, \
+                open(local_path, 'wb') as local_fh:
+            remote_fh.MAX_REQUEST_SIZE = self.chunk_size
+            remote_fh.prefetch(file_size, max_concurrent_requests=TRANSFER_MAX_REQUESTS)
+            received = self._copy_stream(remote_fh, local_fh, file_size, callback)
+        
+        if received != file_size:
+            raise IOError(f"전송 크기 불일치: {received} != {file_size}")
+    
+    def _send_file(
+        self,
+        local_fh,
+        remote_fh,
+        file_size: int,
+        callback: Callable[[int, int], None] = None
+    ) -> int:
+        """
+        로컬 파일을 원격 파일 객체로 전송 (mmap 기반)
+        
+        구현 방식:
+        - 로컬 파일을 mmap으로 매핑하고 memoryview 조각을 그대로 write에 전달
+        - read()마다 새 bytes 버퍼를 만드는 복사 단계가 없음
+        - remote_fh는 bufsize=0(버퍼 없음)으로 열어야 함
+          (버퍼 모드면 BufferedFile이 조각을 내부 BytesIO에 복사한 뒤 getvalue()로 다시 복사)
+        - posix_fadvise(SEQUENTIAL)로 커널에 순차 읽기임을 알려 미리 읽기 확대
+        
+        Args:
+            local_fh: 바이너리 모드로 연 로컬 파일
+            remote_fh: 쓰기 모드로 연 SFTPFile
+            file_size: 전체 크기 (콜백 전달용)
+            callback: paramiko 형식 콜백, 없으면 None
+            
+        Returns:
+            전송한 바이트 수
+        """
+        fd = local_fh.fileno()
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 매핑할 수 없음 (보낼 데이터도 없음)
+            return 0
+        
+        view = memoryview(mapped)
+        try:
+            total = len(view)
+            sent = 0
+            while sent < total:
+                end = min(sent + self.chunk_size, total)
+                remote_fh.write(view[sent:end])
+                sent = end
+                if callback:
+                    callback(sent, file_size)
+            return sent
+        finally:
+            try:
+                view.release()
+                mapped.close()
+            except BufferError:
+                pass  # 예외 추적 정보가 조각을 참조 중이면 GC에 맡김
+    
+    def _copy_stream(
+        self,
+        reader,
+        writer,
+        file_size: int,
+        callback: Callable[[int, int], None]
+    ) -> int:
+        """
+        파일 객체 간 스트림 복사 (진행률 콜백 포함)
+        
+        Args:
+            reader: 읽을 파일 객체 (로컬 파일 또는 SFTPFile)
+            writer: 쓸 파일 객체 (로컬 파일 또는 SFTPFile)
+            file_size: 전체 크기 (콜백 전달용)
+            callback: paramiko 형식 콜백 (현재 바이트, 전체 바이트), 없으면 None
+            
+        Returns:
+            복사한 바이트 수
+        """
+        copied = 0
+        while True:
+            data = reader.read(self.chunk_size)
+            if not data:
+                break
+            writer.write(data)
+            copied += len(data)
+            if callback:
+                callback(copied, file_size)
+        return copied
     
     def _mkdir_p(self, remote_dir: str) -> None:
         """
         원격 디렉토리 재귀적 생성 (mkdir -p와 동일)
         
         구현 방식:
-        - 경로를 위에서부터 순차적으로 생성 시도
-        - 이미 존재하면 무시
+        - stat 확인 없이 가장 깊은 경로부터 바로 mkdir 시도
+        - 상위 디렉토리가 없을 때(FileNotFoundError)만 상위를 만들고 다시 시도
+        - 이미 있는 디렉토리는 mkdir 1회(왕복 1번)로 확인 끝
+        - 확인한 경로는 self._known_dirs에 기억하여 같은 경로는 다시 요청하지 않음
         """
-        if remote_dir in ('', '/', '.'):
+        if remote_dir in ('', '/', '.') or remote_dir in self._known_dirs:
             return
         
-        dirs = []
-        current = remote_dir
-        
-        # 존재하지 않는 디렉토리 경로 수집
-        while current and current != '/':
-            try:
-                self._sftp_client.stat(current)
-                break  # 존재하면 중단
-            except FileNotFoundError:
-                dirs.append(current)
-                current = str(Path(current).parent)
-        
-        # 역순으로 생성 (상위 디렉토리부터)
-        for d in reversed(dirs):
+        try:
+            self._sftp_client.mkdir(remote_dir)
+        except FileNotFoundError:
+            # 상위 디렉토리부터 생성 후 재시도
+            self._mkdir_p(str(Path(remote_dir).parent))
             try:
-                self._sftp_client.mkdir(d)
-            except Exception:
-                pass  # 이미 존재하거나 권한 문제
+                self._sftp_client.mkdir(remote_dir)
+            except IOError:
+                pass  # 그 사이 생성됨
+        except IOError:
+            pass  # 이미 존재하거나 권한 문제
+        
+        self._known_dirs.add(remote_dir)
     
     def __enter__(self):
         self.connect()
@@ -392,11 +771,162 @@ class SFTPTransfer:
         self.disconnect()
 
 
+def _walk_files(directory: str, skip_hidden_dirs: bool = False) -> Iterator[os.DirEntry]:
+    """
+    폴더를 재귀 탐색하며 파일 항목을 하나씩 반환 (os.scandir 기반)
+    
+    Path.rglob + is_file 조합과 달리 디렉토리 항목의 파일 종류 정보를
+    그대로 사용하므로 파일마다 추가 stat 호출이 없습니다.
+    
+    Args:
+        directory: 탐색할 폴더
+        skip_hidden_dirs: True면 '.'으로 시작하는 폴더는 들어가지 않음 (glob의 '**'와 동일)
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if skip_hidden_dirs and entry.name.startswith('.'):
+                    continue
+                yield from _walk_files(entry.path, skip_hidden_dirs)
+            elif entry.is_file():
+                yield entry
+
+
+def _match_pattern(local_path: str) -> tuple[str, list[tuple[str, int]]]:
+    """
+    와일드카드 경로에 맞는 파일 목록 생성
+    
+    구현 방식:
+    - 마지막 요소만 패턴이면 기준 디렉토리를 os.scandir로 한 번 훑으며 fnmatch로 거름
+    - '기준/**/패턴'이면 _walk_files로 하위 폴더까지 한 번에 탐색
+    - 디렉토리 항목의 크기 정보를 그대로 사용 (glob 결과를 다시 stat하지 않음)
+    - 중간 경로에 와일드카드가 있는 경우만 glob 사용
+    - glob과 같이 '.'으로 시작하는 파일은 패턴도 '.'으로 시작할 때만 포함하고,
+      '**'는 숨김 폴더(.git 등)로 들어가지 않음
+    
+    Args:
+        local_path: 와일드카드가 포함된 로컬 경로
+        
+    Returns:
+        (상대 경로 기준 디렉토리, [(파일 경로, 파일 크기)])
+    """
+    base_dir, pattern = os.path.split(local_path)
+    recursive = os.path.basename(base_dir) == '**'
+    if recursive:
+        base_dir = os.path.dirname(base_dir)
+    
+    if '*' in base_dir:
+        # 예: /data/*/logs/*.log
+        base_dir = os.path.dirname(local_path[:local_path.index('*')])
+        files = [
+            (path, os.path.getsize(path))
+            for path in glob.glob(local_path, recursive=True)
+            if os.path.isfile(path)
+        ]
+        return base_dir, files
+    
+    base_dir = base_dir or '.'
+    if not os.path.isdir(base_dir):
+        return base_dir, []
+    
+    if recursive:
+        entries = _walk_files(base_dir, skip_hidden_dirs=True)
+    else:
+        with os.scandir(base_dir) as it:
+            entries = [entry for entry in it if entry.is_file()]
+    
+    include_hidden = pattern.startswith('.')
+    files = [
+        (entry.path, entry.stat().st_size)
+        for entry in entries
+        if (include_hidden or not entry.name.startswith('.'))
+        and fnmatch.fnmatch(entry.name, pattern)
+    ]
+    return base_dir, files
+
+
+def _build_upload_plan(
+    local_path: str,
+    remote_path: str
+) -> tuple[list[tuple[str, str, Optional[int]]], str]:
+    """
+    업로드할 (로컬 파일, 원격 파일, 파일 크기) 목록 생성
+    
+    Args:
+        local_path: 로컬 파일/폴더 경로 (와일드카드 지원: *, **/*)
+        remote_path: 원격 저장 경로
+        
+    Returns:
+        (전송 목록, 오류 메시지)
+    """
+    local = Path(local_path)
+    
+    # 와일드카드 패턴 처리 (예: /path/*.txt, /path/*, /path/**/*.log)
+    # (패턴 경로 자체는 존재하지 않으므로 exists 확인보다 먼저 처리)
+    if '*' in local_path:
+        base_dir, files = _match_pattern(local_path)
+    elif not local.exists():
+        return [], f"로컬 경로를 찾을 수 없습니다: {local_path}"
+    elif local.is_file():
+        # 단일 파일 (원격 경로가 '/'로 끝나면 upload에서 파일명 추가)
+        return [(local_path, remote_path, local.stat().st_size)], ""
+    else:
+        # 폴더 전체 (탐색 중 얻은 크기를 함께 보관하여 업로드 시 재확인 생략)
+        base_dir = str(local)
+        files = [(entry.path, entry.stat().st_size) for entry in _walk_files(base_dir)]
+    
+    if not files:
+        return [], "전송할 파일이 없습니다."
+    
+    # 상대 경로는 접두사를 잘라내어 계산 (파일마다 relpath의 abspath/getcwd 호출 없음)
+    local_prefix = base_dir if not base_dir or base_dir.endswith(os.sep) else base_dir + os.sep
+    prefix_len = len(local_prefix)
+    remote_prefix = remote_path.replace('\\', '/')
+    if not remote_prefix.endswith('/'):
+        remote_prefix += '/'
+    
+    plan = []
+    for local_file, file_size in files:
+        if local_file.startswith(local_prefix):
+            rel_path = local_file[prefix_len:]
+        else:
+            rel_path = os.path.relpath(local_file, base_dir)
+        if _SEP_REPLACE:
+            rel_path = rel_path.replace(os.sep, '/')
+        plan.append((local_file, remote_prefix + rel_path, file_size))
+    return plan, ""
+
+
+def _should_compress(server: Server, plan: list[tuple[str, str, Optional[int]]]) -> bool:
+    """
+    업로드에 SSH 압축을 사용할지 판단
+    
+    로컬 호스트가 아니고 전송 목록에 텍스트 계열 파일이 있으면 압축합니다.
+    (CPU를 더 쓰는 대신 대역폭이 좁은 회선에서 전송량 감소)
+    """
+    if server.host in LOCAL_HOSTS or server.host.startswith('127.'):
+        return False
+    return any(
+        os.path.splitext(local_file)[1].lower() in COMPRESSIBLE_EXTENSIONS
+        for local_file, _, _ in plan
+    )
+
+
 class MultiFileTransfer:
     """다중 서버 파일 전송 관리 클래스"""
     
-    def __init__(self):
-        self._lock = threading.Lock()
+    # 전체 동시 전송 스레드 수 상한
+    MAX_WORKERS = 32
+    
+    # 서버당 동시에 파일을 전송하는 연결(스트림) 수
+    STREAMS_PER_SERVER = 4
+    
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        """
+        Args:
+            max_workers: 동시 전송 스레드 수 상한
+        """
+        self.max_workers = max_workers
     
     def upload_to_servers(
         self,
@@ -409,60 +939,164 @@ class MultiFileTransfer:
         """
         여러 서버에 같은 파일/폴더 동시 업로드
         
+        구현 방식:
+        - 전송할 파일 목록은 호출 스레드에서 한 번만 생성 (서버마다 재탐색 안 함)
+        - 서버마다 파일 큐(deque)를 두고 STREAMS_PER_SERVER개의 스트림이 나눠 처리
+        - 큰 파일부터 처리 (LPT 스케줄링: 마지막에 큰 파일 하나만 남아 늘어지는 것 방지)
+        - 각 스트림은 SFTP 연결 1개를 재사용하므로 파일마다 SSH 핸드셰이크 없음
+        - 전체 스레드 수는 max_workers로 제한 (서버가 많아도 스레드 폭증 없음)
+        - 원격 서버에 텍스트 계열 파일을 보낼 때는 SSH 압축 사용 (_should_compress)
+        - 폴더 업로드는 서버마다 tar 스트림 1개로 먼저 시도하고,
+          tar를 쓸 수 없는 서버만 파일별 스트림 업로드로 처리
+        
         Args:
             servers: 대상 서버 목록
             local_path: 로컬 파일/폴더 경로 (와일드카드 지원: *, **/*)
             remote_path: 원격 저장 경로
             progress_callback: 진행률 콜백
-            result_callback: 각 서버 전송 완료 시 콜백
+            result_callback: 각 파일 전송 완료 시 콜백
             
         Returns:
             모든 서버의 전송 결과
         """
-        results = []
-        result_queue = Queue()
-        threads = []
+        plan, error = _build_upload_plan(local_path, remote_path)
+        if error:
+            results = [
+                TransferResult(
+                    server=server,
+                    local_path=local_path,
+                    remote_path=remote_path,
+                    success=False,
+                    error_message=error
+                )
+                for server in servers
+            ]
+            if result_callback:
+                for result in results:
+                    result_callback(result)
+            return results
         
-        # 폴더/와일드카드 여부 확인
-        is_directory = Path(local_path).is_dir() if '*' not in local_path else False
-        is_pattern = '*' in local_path
+        def tar_task(server: Server) -> Optional[list[TransferResult]]:
+            """
+            폴더 전체를 tar 스트림 1개로 업로드
+            
+            Returns:
+                전송 결과 (연결 실패 시 파일별 실패), tar를 쓸 수 없으면 None
+            """
+            transfer = SFTPTransfer(server, compress=_should_compress(server, plan))
+            try:
+                connected, error = transfer.connect()
+                if not connected:
+                    return [
+                        TransferResult(
+                            server=server,
+                            local_path=local_file,
+                            remote_path=remote_file,
+                            success=False,
+                            error_message=error
+                        )
+                        for local_file, remote_file, _ in plan
+                    ]
+                return transfer._upload_tar(plan, remote_path.replace('\\', '/'), progress_callback)
+            finally:
+                transfer.disconnect()
         
-        def upload_task(server: Server):
-            transfer = SFTPTransfer(server)
+        def stream_task(server: Server, work: deque, state: dict) -> list[TransferResult]:
+            """
+            서버 파일 큐가 빌 때까지 하나의 연결로 순차 업로드
+            
+            SSH 핸드셰이크는 서버당 한 스트림만 시도하고 실패하면 나머지 스트림은 재시도하지 않습니다.
+            (연결할 수 없는 서버에서 타임아웃을 스트림 수만큼 기다리지 않고,
+             비밀번호가 틀렸을 때 로그인 실패가 한 번만 기록되어 계정 잠금을 피함)
+            - 핸드셰이크에 실패한 스트림이 남은 파일을 모두 실패 처리
+            - 인증 후 채널 열기에 실패한 스트림(MaxSessions 등)은 큐를 건드리지 않고 끝냄
+              (이미 연결된 같은 서버의 다른 스트림이 처리)
+            """
+            stream_results = []
+            transfer = SFTPTransfer(server, compress=_should_compress(server, plan))
             try:
-                if is_directory or is_pattern:
-                    # 폴더 또는 패턴 업로드
-                    file_results = transfer.upload_directory(local_path, remote_path, progress_callback)
-                    for r in file_results:
-                        result_queue.put(r)
-                        if result_callback:
-                            result_callback(r)
-                else:
-                    # 단일 파일 업로드
-                    result = transfer.upload(local_path, remote_path, progress_callback)
-                    result_queue.put(result)
+                with state['lock']:
+                    if state['error'] is not None:
+                        return stream_results  # 핸드셰이크 실패는 먼저 시도한 스트림이 처리
+                    handshake = not state['ready']
+                    if handshake:
+                        # 다른 스트림은 이 결과를 기다렸다가 성공했을 때만 채널을 엶
+                        connected, error = transfer.connect()
+                        if connected:
+                            state['ready'] = True
+                        else:
+                            state['error'] = error
+                
+                if not handshake:
+                    # 인증된 Transport가 캐시에 있으므로 SFTP 채널만 새로 엶
+                    connected, error = transfer.connect()
+                    if not connected:
+                        return stream_results
+                
+                while True:
+                    try:
+                        local_file, remote_file, file_size = work.popleft()
+                    except IndexError:
+                        break
+                    
+                    if connected:
+                        result = transfer.upload(local_file, remote_file, progress_callback, file_size)
+                    else:
+                        result = TransferResult(
+                            server=server,
+                            local_path=local_file,
+                            remote_path=remote_file,
+                            success=False,
+                            error_message=error
+                        )
+                    stream_results.append(result)
                     if result_callback:
                         result_callback(result)
             finally:
                 transfer.disconnect()
+            return stream_results
         
-        # 각 서버마다 스레드 생성
-        for server in servers:
-            thread = threading.Thread(target=upload_task, args=(server,))
-            thread.start()
-            threads.append(thread)
+        results = []
         
-        # 모든 스레드 완료 대기
-        for thread in threads:
-            thread.join()
+        # 폴더 업로드: 서버마다 tar 스트림 1개 (채널 1개, 파일마다 open/close 왕복 없음)
+        if '*' not in local_path and os.path.isdir(local_path):
+            max_workers = max(1, min(self.max_workers, len(servers)))
+            fallback_servers = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(tar_task, server): server for server in servers}
+                # 끝난 서버부터 바로 결과 보고 (느린 서버를 기다리지 않음)
+                for future in as_completed(futures):
+                    server_results = future.result()
+                    if server_results is None:
+                        fallback_servers.append(futures[future])
+                        continue
+                    results.extend(server_results)
+                    if result_callback:
+                        for result in server_results:
+                            result_callback(result)
+            servers = fallback_servers
+            if not servers:
+                return results
         
-        # 결과 수집
-        while True:
-            try:
-                result = result_queue.get_nowait()
-                results.append(result)
-            except Empty:
-                break
+        plan.sort(key=lambda item: item[2] or 0, reverse=True)
+        
+        streams = min(self.STREAMS_PER_SERVER, len(plan))
+        # 서버별 (파일 큐, 연결 상태: 핸드셰이크 성공 여부 / 핸드셰이크 오류)
+        work_queues = [
+            (server, deque(plan), {'lock': threading.Lock(), 'ready': False, 'error': None})
+            for server in servers
+        ]
+        max_workers = max(1, min(self.max_workers, len(servers) * streams))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 모든 서버가 첫 스트림부터 시작하도록 서버 순서로 번갈아 제출
+            futures = [
+                executor.submit(stream_task, server, work, state)
+                for _ in range(streams)
+                for server, work, state in work_queues
+            ]
+            for future in futures:
+                results.extend(future.result())
         
         return results
     
@@ -515,12 +1149,9 @@ class MultiFileTransfer:
         Returns:
             각 서버의 다운로드 결과
         """
-        import zipfile
-        import tempfile
-        import shutil
-        
+        # 스레드마다 결과가 1개뿐이므로 Queue 대신 리스트에 추가
+        # (list.append는 GIL 아래에서 원자적이라 별도 잠금 불필요)
         results = []
-        result_queue = Queue()
         threads = []
         
         # 폴더 이름 추출
@@ -543,7 +1174,7 @@ class MultiFileTransfer:
                         success=False,
                         error_message=error
                     )
-                    result_queue.put(result)
+                    results.append(result)
                     if result_callback:
                         result_callback(result)
                     return
@@ -564,19 +1195,18 @@ class MultiFileTransfer:
                             remote_item = f"{remote_dir}/{item.filename}"
                             local_item = os.path.join(local_dir, item.filename)
                             
-                            if stat_module.S_ISDIR(item.st_mode):
+                            if stat.S_ISDIR(item.st_mode):
                                 # 디렉토리면 재귀
                                 os.makedirs(local_item, exist_ok=True)
                                 download_recursive(remote_item, local_item)
                             else:
                                 # 파일이면 다운로드
-                                transfer._sftp_client.get(remote_item, local_item)
+                                transfer._fetch_file(remote_item, local_item, item.st_size)
                                 downloaded_files.append(local_item)
                                 total_size += item.st_size
                     except Exception as e:
                         pass  # 권한 없는 파일 스킵
                 
-                import stat as stat_module
                 download_recursive(remote_path.rstrip('/'), temp_folder)
                 
                 # zip 파일 생성 (폴더명_IP주소.zip)
@@ -597,7 +1227,7 @@ class MultiFileTransfer:
                     success=True,
                     transferred_bytes=zip_size
                 )
-                result_queue.put(result)
+                results.append(result)
                 if result_callback:
                     result_callback(result)
                     
@@ -609,7 +1239,7 @@ class MultiFileTransfer:
                     success=False,
                     error_message=str(e)
                 )
-                result_queue.put(result)
+                results.append(result)
                 if result_callback:
                     result_callback(result)
             finally:
@@ -628,24 +1258,21 @@ class MultiFileTransfer:
         for thread in threads:
             thread.join()
         
-        # 결과 수집
-        while True:
-            try:
-                result = result_queue.get_nowait()
-                results.append(result)
-            except Empty:
-                break
-        
         return results
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_size(size_bytes: int) -> str:
-    """바이트를 읽기 쉬운 단위로 변환"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    """
+    바이트를 읽기 쉬운 단위로 변환
+    
+    단위는 비트 길이로 바로 결정 (1024 = 2^10이므로 10비트마다 한 단위)
+    하여 단위마다 나눗셈을 반복하지 않습니다.
+    """
+    unit = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def format_speed(bytes_per_sec: float) -> str:
@@ -11,8 +11,6 @@ SSH Manager - 메인 진입점
 import sys
 import argparse
 
-from .ui import main as ui_main, console
-
 
 def parse_args():
     """명령줄 인수 파싱"""
@@ -45,6 +43,9 @@ def main():
     """메인 함수"""
     args = parse_args()
     
+    # UI 모듈(paramiko, rich 등)은 인수 처리 뒤에 로드 (--help/--version은 즉시 응답)
+    from .ui import main as ui_main, console
+    
     # 터미널 환경 체크
     if not sys.stdin.isatty():
         console.print("[red]오류: 터미널 환경에서 실행해주세요.[/red]")
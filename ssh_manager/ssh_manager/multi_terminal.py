@@ -16,16 +16,38 @@ tmux 장점:
 - 세션 분리/재연결 가능
 """
 
+import atexit
 import os
+import re
+import math
+import importlib.util
 import sys
+import codecs
 import shutil
+import functools
 import subprocess
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pathlib import Path
 
 from .server import Server
+from .ssh_client import create_transport
+
+# asyncssh (선택) - 설치되어 있으면 textual 패인이 이벤트 루프에서 직접 SSH 처리
+# (import 자체가 무거워 설치 여부만 확인하고 실제 로드는 첫 접속 때)
+ASYNCSSH_AVAILABLE = importlib.util.find_spec('asyncssh') is not None
+
+
+# 패인 출력에서 제거할 ANSI 이스케이프 코드 (화면 모드/지우기, 커서 이동, 색상)
+# 패턴 3개를 하나로 합쳐 출력 한 조각당 한 번만 훑음
+# 숫자 접두부를 공유해 분기 간 되추적을 없애고, re.ASCII로 \d를 ASCII 숫자로 한정
+_ANSI_RE = re.compile(
+    r'\x1b\[(?:\?\d*[hlJK]|\d*(?:[hlJKABCD]|(?:;[\d;]*)?m))',
+    re.ASCII,
+)
 
 
 def is_tmux_available() -> bool:
@@ -53,8 +75,19 @@ class TmuxMultiTerminal:
     
     SESSION_NAME = "ssh_manager"
     
+    # SSH 연결 다중화 옵션
+    # - 같은 서버로의 추가 접속은 마스터 연결을 재사용 (TCP/키 교환/인증 생략)
+    # - 마스터는 마지막 세션 종료 후 10분간 유지되어 재실행 시에도 재사용
+    SSH_CONTROL_OPTIONS = [
+        '-o', 'ControlMaster=auto',
+        '-o', 'ControlPath=~/.ssh/ssh_manager-%C',
+        '-o', 'ControlPersist=600',
+        '-o', 'ServerAliveInterval=30',
+    ]
+    
     def __init__(self):
         self.servers: list[Server] = []
+        self._password_dir: Optional[str] = None  # 패인용 비밀번호 파일 디렉토리
     
     def launch(self, servers: list[Server], sync_input: bool = True) -> bool:
         """
@@ -77,59 +110,55 @@ class TmuxMultiTerminal:
         
         self.servers = servers
         
+        # ControlPath 소켓 디렉토리 준비 후, 같은 서버가 여러 패인에
+        # 열리는 경우 마스터 연결을 먼저 생성
+        os.makedirs(os.path.expanduser('~/.ssh'), mode=0o700, exist_ok=True)
+        self._prewarm_masters(servers)
+        
         # 기존 세션 종료
         subprocess.run(
             ['tmux', 'kill-session', '-t', self.SESSION_NAME],
             capture_output=True
         )
+        self._cleanup_password_files()
         
-        # 첫 번째 서버로 새 세션 생성
-        first_server = servers[0]
-        ssh_cmd = self._build_ssh_command(first_server)
+        # 세션 구성 명령을 모아 tmux 한 번 실행으로 처리
+        # (명령마다 subprocess를 띄우면 서버 수 x 2번 fork/exec 발생)
+        target = f'{self.SESSION_NAME}:ssh'
         
-        subprocess.run([
-            'tmux', 'new-session', '-d',
+        # 첫 번째 서버로 새 세션 생성
+        commands = [[
+            'new-session', '-d',
             '-s', self.SESSION_NAME,
             '-n', 'ssh',
-            ssh_cmd
-        ])
+            *self._build_ssh_command(servers[0])
+        ]]
         
         # 나머지 서버들을 분할 패인으로 추가
         for i, server in enumerate(servers[1:], start=1):
-            ssh_cmd = self._build_ssh_command(server)
-            
             # 수평/수직 분할 번갈아 사용
             split_opt = '-h' if i % 2 == 1 else '-v'
-            
-            subprocess.run([
-                'tmux', 'split-window', split_opt,
-                '-t', f'{self.SESSION_NAME}:ssh',
-                ssh_cmd
+            commands.append([
+                'split-window', split_opt, '-t', target,
+                *self._build_ssh_command(server)
             ])
             
-            # 레이아웃 균등 분배
-            subprocess.run([
-                'tmux', 'select-layout', '-t', f'{self.SESSION_NAME}:ssh',
-                'tiled'
-            ])
+            # 레이아웃 균등 분배 (패인이 작아져 다음 분할이 실패하지 않도록 매번)
+            commands.append(['select-layout', '-t', target, 'tiled'])
         
         # 동기화 입력 설정 (모든 패인에 동시 입력)
         if sync_input:
-            subprocess.run([
-                'tmux', 'set-window-option', '-t', f'{self.SESSION_NAME}:ssh',
-                'synchronize-panes', 'on'
-            ])
+            commands.append(['set-window-option', '-t', target, 'synchronize-panes', 'on'])
         
         # 패인 테두리에 서버 정보 표시
-        subprocess.run([
-            'tmux', 'set-option', '-t', self.SESSION_NAME,
-            'pane-border-status', 'top'
-        ])
-        subprocess.run([
-            'tmux', 'set-option', '-t', self.SESSION_NAME,
+        commands.append(['set-option', '-t', self.SESSION_NAME, 'pane-border-status', 'top'])
+        commands.append([
+            'set-option', '-t', self.SESSION_NAME,
             'pane-border-format', ' #{pane_index}: #{pane_title} '
         ])
         
+        self._run_tmux_batch(commands)
+        
         # 세션 attach (현재 터미널에 표시)
         # subprocess.call 사용하여 tmux 종료 후 메인 메뉴로 돌아오기
         if is_running_in_tmux():
@@ -138,28 +167,109 @@ class TmuxMultiTerminal:
         else:
             # tmux 밖이면 attach (종료 후 돌아옴)
             subprocess.call(['tmux', 'attach-session', '-t', self.SESSION_NAME])
+            self._cleanup_password_files()
         
         return True
     
-    def _build_ssh_command(self, server: Server) -> str:
+    @staticmethod
+    def _run_tmux_batch(commands: list[list[str]]) -> subprocess.CompletedProcess:
+        """
+        여러 tmux 명령을 한 번의 tmux 실행으로 처리
+        
+        tmux는 ';' 인자로 구분된 명령 목록을 순서대로 실행합니다.
+        예: tmux new-session -d ... ; split-window ... ; select-layout tiled
+        """
+        args = ['tmux']
+        for i, command in enumerate(commands):
+            if i > 0:
+                args.append(';')
+            args.extend(command)
+        return subprocess.run(args)
+    
+    def _prewarm_masters(self, servers: list[Server]) -> None:
         """
-        SSH 명령어 생성
+        중복 서버의 SSH 마스터 연결 미리 생성
         
-        sshpass를 사용하여 비밀번호 자동 입력
-        sshpass가 없으면 일반 ssh (수동 비밀번호 입력)
+        같은 서버로 여러 패인이 동시에 접속하면 모두 마스터가 되려고 경쟁하여
+        각자 전체 핸드셰이크를 하게 됩니다. 마스터를 먼저 띄워 두면
+        나머지 패인은 기존 연결 위에 세션만 엽니다.
         """
+        seen = set()
+        duplicates = {}
+        for server in servers:
+            key = (server.username, server.host, server.port)
+            if key in seen:
+                duplicates[key] = server
+            seen.add(key)
+        
+        if not duplicates:
+            return
+        
+        for server in duplicates.values():
+            cmd = [
+                'ssh', '-M', '-N', '-f',
+                '-o', 'StrictHostKeyChecking=no',
+                *self.SSH_CONTROL_OPTIONS,
+                '-p', str(server.port),
+                f'{server.username}@{server.host}',
+            ]
+            env = None
+            if shutil.which('sshpass'):
+                # 비밀번호는 환경변수로 전달 (ps 출력에 노출 방지)
+                cmd = ['sshpass', '-e'] + cmd
+                env = dict(os.environ, SSHPASS=server.password)
+            
+            try:
+                subprocess.run(cmd, env=env, timeout=30)
+            except (OSError, subprocess.TimeoutExpired):
+                pass  # 실패해도 각 패인이 개별 접속
+    
+    def _build_ssh_command(self, server: Server) -> list[str]:
+        """
+        SSH 명령어 생성 (tmux에 인자 목록으로 전달)
+        
+        구현 방식:
+        - 인자 목록으로 전달하면 tmux가 /bin/sh 없이 바로 실행 (패인마다 셸 fork 생략)
+        - sshpass가 있으면 비밀번호 파일(-f)로 자동 입력
+          (명령줄에 비밀번호가 없어 ps 출력에 노출되지 않고 따옴표 문제도 없음)
+        - sshpass가 없으면 일반 ssh (수동 비밀번호 입력)
+        """
+        cmd = [
+            'ssh',
+            '-o', 'StrictHostKeyChecking=no',
+            *self.SSH_CONTROL_OPTIONS,
+            '-p', str(server.port),
+            f'{server.username}@{server.host}',
+        ]
         if shutil.which('sshpass'):
-            # sshpass로 비밀번호 자동 입력
-            return (
-                f"sshpass -p '{server.password}' ssh -o StrictHostKeyChecking=no "
-                f"-p {server.port} {server.username}@{server.host}"
-            )
-        else:
-            # 일반 SSH (비밀번호 수동 입력)
-            return (
-                f"ssh -o StrictHostKeyChecking=no "
-                f"-p {server.port} {server.username}@{server.host}"
-            )
+            cmd = ['sshpass', '-f', self._write_password_file(server)] + cmd
+        return cmd
+    
+    def _write_password_file(self, server: Server) -> str:
+        """
+        sshpass -f용 비밀번호 파일 생성
+        
+        sshpass는 비밀번호 프롬프트가 나올 때 파일을 읽으므로 세션이 끝날 때까지 유지합니다.
+        (소유자만 접근 가능한 임시 디렉토리/파일, 다음 launch 또는 attach 종료 시 삭제)
+        이미 tmux 안에서 switch-client로 띄운 경우를 위해 프로그램 종료 시에도 삭제합니다.
+        """
+        if self._password_dir is None:
+            self._password_dir = tempfile.mkdtemp(prefix='ssh_manager-')
+            atexit.register(self._cleanup_password_files)
+        
+        fd, path = tempfile.mkstemp(dir=self._password_dir)
+        try:
+            os.write(fd, server.password.encode())
+        finally:
+            os.close(fd)
+        return path
+    
+    def _cleanup_password_files(self) -> None:
+        """비밀번호 파일 디렉토리 삭제 (종료 시 정리 등록도 해제)"""
+        if self._password_dir is not None:
+            shutil.rmtree(self._password_dir, ignore_errors=True)
+            self._password_dir = None
+            atexit.unregister(self._cleanup_password_files)
     
     @staticmethod
     def toggle_sync() -> None:
@@ -183,7 +293,7 @@ class TmuxMultiTerminal:
 try:
     from textual.app import App, ComposeResult
     from textual.containers import Container, Horizontal, Vertical, Grid
-    from textual.widgets import Header, Footer, Static, Input, RichLog, Label
+    from textual.widgets import Header, Footer, Static, Input, RichLog
     from textual.binding import Binding
     from textual import events
     from rich.text import Text
@@ -200,29 +310,56 @@ if TEXTUAL_AVAILABLE:
     class TerminalPane(Static):
         """단일 SSH 터미널 패인"""
         
+        # 수신 출력을 모아서 화면에 쓰는 간격 (초, 약 1프레임)
+        OUTPUT_FLUSH_INTERVAL = 0.016
+        
+        # 패인별 스크롤백 최대 줄 수 (오래된 줄부터 버림)
+        SCROLLBACK_LINES = 2000
+        
         def __init__(self, server: Server, pane_id: int, **kwargs):
             super().__init__(**kwargs)
             self.server = server
             self.pane_id = pane_id
             self.ssh_conn = None
             self.channel = None
-            self.output_buffer = []
+            self.process = None  # asyncssh 사용 시 원격 쉘 프로세스
             self._running = False
+            
+            # 읽기 스레드가 받은 출력 조각 (UI 스레드에서 모아서 한 번에 기록)
+            self._pending: list[str] = []
+            self._pending_lock = threading.Lock()
+            self._flush_scheduled = False
+            self._loop = None
+            
+            # 조각 경계에서 잘린 멀티바이트 문자(한글 등)를 다음 조각과 이어서 디코딩
+            self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
         
         def compose(self) -> ComposeResult:
-            yield RichLog(id=f"log_{self.pane_id}", wrap=True, markup=True)
+            yield RichLog(
+                id=f"log_{self.pane_id}",
+                wrap=True,
+                markup=True,
+                max_lines=self.SCROLLBACK_LINES,
+            )
         
         async def on_mount(self) -> None:
             """마운트 시 SSH 연결"""
+            # 서버 이름은 별도 Label 대신 테두리 제목으로 표시 (위젯 수 절약)
+            self.border_title = f" {self.server.name} ({self.server.host}) "
             self._running = True
             asyncio.create_task(self._connect_ssh())
         
         async def _connect_ssh(self) -> None:
             """SSH 연결 및 출력 읽기"""
             log = self.query_one(f"#log_{self.pane_id}", RichLog)
+            self._loop = asyncio.get_running_loop()
             log.write(f"[yellow]연결 중: {self.server.name}[/yellow]")
             log.write(f"[dim]{self.server.username}@{self.server.host}:{self.server.port}[/dim]")
             
+            if ASYNCSSH_AVAILABLE:
+                await self._connect_asyncssh(log)
+                return
+            
             try:
                 import paramiko
                 
@@ -230,16 +367,22 @@ if TEXTUAL_AVAILABLE:
                 self.ssh_conn = paramiko.SSHClient()
                 self.ssh_conn.set_missing_host_key_policy(paramiko.AutoAddPolicy())
                 
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.ssh_conn.connect(
+                # 앱 전용 접속 스레드 풀 사용 (기본 executor는 스레드 수가 적어
+                # 서버가 많으면 접속이 순서대로 밀림)
+                await self._loop.run_in_executor(
+                    self.app.connect_pool,
+                    functools.partial(
+                        self.ssh_conn.connect,
                         hostname=self.server.host,
                         port=self.server.port,
                         username=self.server.username,
                         password=self.server.password,
                         timeout=30,
+                        banner_timeout=15,  # 응답 없는 서버가 스레드를 오래 잡지 않도록
+                        auth_timeout=15,
                         allow_agent=False,
                         look_for_keys=False,
+                        transport_factory=create_transport,
                     )
                 )
                 
@@ -249,39 +392,141 @@ if TEXTUAL_AVAILABLE:
                     width=80,
                     height=24
                 )
-                self.channel.settimeout(0.1)
+                self.channel.settimeout(None)
                 
                 log.write(f"[green]연결됨![/green]\n")
                 
-                # 출력 읽기 루프
-                while self._running:
-                    try:
-                        if self.channel.recv_ready():
-                            data = self.channel.recv(4096)
-                            if data:
-                                text = data.decode('utf-8', errors='replace')
-                                # ANSI 이스케이프 코드 일부 처리
-                                text = self._clean_ansi(text)
-                                log.write(text)
-                        await asyncio.sleep(0.05)
-                    except Exception:
-                        await asyncio.sleep(0.1)
+                # 출력 읽기는 별도 스레드에서 블로킹 recv로 처리
+                # (주기적으로 recv_ready를 확인하는 폴링 없이 데이터가 오면 바로 표시)
+                threading.Thread(
+                    target=self._read_loop,
+                    args=(log,),
+                    name=f"pane-reader-{self.pane_id}",
+                    daemon=True
+                ).start()
                         
             except Exception as e:
                 log.write(f"[red]연결 실패: {e}[/red]")
         
+        async def _connect_asyncssh(self, log: RichLog) -> None:
+            """
+            asyncssh로 SSH 연결 및 출력 읽기
+            
+            구현 방식:
+            - 접속/읽기 모두 이벤트 루프에서 처리 (접속 스레드 풀, 읽기 스레드 불필요)
+            - 출력은 paramiko 경로와 같이 모아서 한 번에 기록
+            """
+            try:
+                import asyncssh
+                
+                self.ssh_conn = await asyncssh.connect(
+                    self.server.host,
+                    port=self.server.port,
+                    username=self.server.username,
+                    password=self.server.password,
+                    known_hosts=None,
+                    client_keys=None,
+                    agent_path=None,
+                    connect_timeout=30,
+                    login_timeout=15,
+                )
+                self.process = await self.ssh_conn.create_process(
+                    term_type='xterm-256color',
+                    term_size=(80, 24),
+                    encoding='utf-8',
+                    errors='replace',
+                )
+            except Exception as e:
+                log.write(f"[red]연결 실패: {e}[/red]")
+                return
+            
+            log.write(f"[green]연결됨![/green]\n")
+            
+            while self._running:
+                try:
+                    text = await self.process.stdout.read(65536)
+                except Exception:
+                    break
+                if not text:
+                    break
+                self._push_output(self._clean_ansi(text), log)
+        
+        def _read_loop(self, log: RichLog) -> None:
+            """
+            채널 출력 읽기 루프 (읽기 스레드에서 실행)
+            
+            recv는 데이터가 올 때까지 대기하므로 유휴 상태에서 CPU를 쓰지 않습니다.
+            채널이 닫히면(disconnect 또는 원격 쉘 종료) 빈 데이터/예외로 루프가 끝납니다.
+            
+            받은 조각은 바로 쓰지 않고 모아 두었다가 OUTPUT_FLUSH_INTERVAL 뒤
+            UI 스레드에서 한 번에 기록합니다. (조각마다 RichLog를 다시 그리지 않음)
+            
+            디코딩은 증분 디코더로 하여 조각 끝에 걸친 멀티바이트 문자가 깨지지 않고,
+            채널이 닫힐 때 남은 바이트를 마저 내보냅니다.
+            """
+            while self._running:
+                try:
+                    data = self.channel.recv(65536)
+                except Exception:
+                    data = b''
+                final = not data
+                
+                text = self._decoder.decode(data, final=final)
+                if text:
+                    # ANSI 이스케이프 코드 일부 처리
+                    text = self._clean_ansi(text)
+                    try:
+                        self._push_output(text, log)
+                    except RuntimeError:
+                        break  # 앱 종료로 이벤트 루프가 닫힘
+                
+                if final:
+                    break
+        
+        def _push_output(self, text: str, log: RichLog) -> None:
+            """
+            출력 조각을 모아 두고, 예약된 기록이 없으면 OUTPUT_FLUSH_INTERVAL 뒤로 예약
+            
+            읽기 스레드와 이벤트 루프 어느 쪽에서 호출해도 됩니다.
+            """
+            with self._pending_lock:
+                self._pending.append(text)
+                if self._flush_scheduled:
+                    return
+                self._flush_scheduled = True
+            
+            self._loop.call_soon_threadsafe(
+                self._loop.call_later,
+                self.OUTPUT_FLUSH_INTERVAL,
+                self._flush_output,
+                log
+            )
+        
+        def _flush_output(self, log: RichLog) -> None:
+            """모아 둔 출력을 RichLog에 한 번에 기록 (UI 스레드에서 실행)"""
+            with self._pending_lock:
+                text = ''.join(self._pending)
+                self._pending.clear()
+                self._flush_scheduled = False
+            
+            if text:
+                log.write(text)
+        
         def _clean_ansi(self, text: str) -> str:
             """ANSI 이스케이프 코드 정리 (기본적인 것만)"""
-            import re
-            # 커서 이동 등 일부 제어 문자 제거
-            text = re.sub(r'\x1b\[\??\d*[hlJK]', '', text)
-            text = re.sub(r'\x1b\[\d*[ABCD]', '', text)
-            text = re.sub(r'\x1b\[[\d;]*m', '', text)  # 색상 코드 제거
-            return text
+            # 이스케이프 문자가 없으면 정규식 생략 (명령 에코 등 대부분의 출력)
+            if '\x1b' not in text:
+                return text
+            return _ANSI_RE.sub('', text)
         
         def send_input(self, text: str) -> None:
             """입력 전송"""
-            if self.channel:
+            if self.process:
+                try:
+                    self.process.stdin.write(text)
+                except Exception:
+                    pass
+            elif self.channel:
                 try:
                     self.channel.send(text)
                 except Exception:
@@ -290,6 +535,11 @@ if TEXTUAL_AVAILABLE:
         def disconnect(self) -> None:
             """연결 종료"""
             self._running = False
+            if self.process:
+                try:
+                    self.process.close()
+                except Exception:
+                    pass
             if self.channel:
                 try:
                     self.channel.close()
@@ -308,7 +558,6 @@ if TEXTUAL_AVAILABLE:
         CSS = """
         Screen {
             layout: grid;
-            grid-size: 2;
             grid-gutter: 1;
         }
         
@@ -327,13 +576,6 @@ if TEXTUAL_AVAILABLE:
             width: 100%;
         }
         
-        .pane-title {
-            background: $primary;
-            color: $text;
-            text-align: center;
-            height: 1;
-        }
-        
         RichLog {
             height: 100%;
             scrollbar-gutter: stable;
@@ -346,25 +588,29 @@ if TEXTUAL_AVAILABLE:
             Binding("escape", "quit", "종료"),
         ]
         
+        # 동시 SSH 접속 스레드 수 상한
+        MAX_CONNECT_WORKERS = 64
+        
         def __init__(self, servers: list[Server], **kwargs):
             super().__init__(**kwargs)
             self.servers = servers
             self.panes: list[TerminalPane] = []
             self.sync_mode = True  # 동기화 입력 모드
+            
+            # 모든 패인이 동시에 접속하도록 서버 수만큼 스레드 준비
+            self.connect_pool = ThreadPoolExecutor(
+                max_workers=max(1, min(self.MAX_CONNECT_WORKERS, len(servers))),
+                thread_name_prefix='pane-connect'
+            )
         
         def compose(self) -> ComposeResult:
             yield Header(show_clock=True)
             
-            # 서버 수에 따라 그리드 레이아웃 조정
-            num_servers = len(self.servers)
-            
+            # 패인은 컨테이너로 감싸지 않고 그리드에 바로 배치
             for i, server in enumerate(self.servers):
                 pane = TerminalPane(server, i, id=f"pane_{i}")
                 self.panes.append(pane)
-                
-                with Container(id=f"container_{i}"):
-                    yield Label(f" {server.name} ({server.host}) ", classes="pane-title")
-                    yield pane
+                yield pane
             
             with Container(id="input_container"):
                 yield Input(
@@ -374,6 +620,10 @@ if TEXTUAL_AVAILABLE:
             
             yield Footer()
         
+        def on_mount(self) -> None:
+            """서버 수에 맞춰 그리드 열 수 설정 (정사각형에 가깝게, CSS에는 열 수를 두지 않음)"""
+            self.screen.styles.grid_size_columns = max(1, math.ceil(math.sqrt(len(self.servers))))
+        
         async def on_input_submitted(self, event: Input.Submitted) -> None:
             """명령어 입력 처리"""
             command = event.value + "\n"
@@ -398,6 +648,7 @@ if TEXTUAL_AVAILABLE:
             """종료"""
             for pane in self.panes:
                 pane.disconnect()
+            self.connect_pool.shutdown(wait=False, cancel_futures=True)
             self.exit()
 
 
@@ -443,5 +694,6 @@ def check_dependencies() -> dict:
         'tmux': is_tmux_available(),
         'sshpass': shutil.which('sshpass') is not None,
         'textual': TEXTUAL_AVAILABLE,
+        'asyncssh': ASYNCSSH_AVAILABLE,
     }
 
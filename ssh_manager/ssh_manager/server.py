@@ -26,11 +26,34 @@
 """
 
 import json
+import os
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional
-from .crypto import CryptoManager
+from .crypto import CryptoManager, write_private_file
+
+# orjson이 있으면 사용 (표준 json보다 직렬화/역직렬화가 빠름, 없으면 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj) -> bytes:
+    """JSON 직렬화 (들여쓰기 2칸, 한글 그대로 UTF-8)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """JSON 역직렬화"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 @dataclass
@@ -46,10 +69,23 @@ class Server:
     group: str = "default"              # 서버 그룹
     description: str = ""               # 서버 설명
     
+    # 검색용 소문자 문자열 (이름/호스트/설명, 저장하지 않음)
+    _search_blob: str = field(init=False, default="", repr=False, compare=False)
+    
     def __post_init__(self):
         """이름이 없으면 호스트를 이름으로 사용"""
         if not self.name:
             self.name = self.host
+        self.refresh_search_blob()
+    
+    def refresh_search_blob(self) -> None:
+        """
+        검색용 문자열 갱신 (이름/호스트/설명 변경 후 호출)
+        
+        검색할 때마다 세 필드를 각각 lower() 하지 않도록 미리 합쳐 둡니다.
+        (구분자 \0은 필드 경계를 넘는 일치 방지)
+        """
+        self._search_blob = f"{self.name}\0{self.host}\0{self.description}".lower()
     
     def to_dict(self, include_password: bool = True) -> dict:
         """
@@ -58,7 +94,18 @@ class Server:
         Args:
             include_password: 비밀번호 포함 여부
         """
-        data = asdict(self)
+        # 필드가 모두 str/int라 asdict의 재귀 복사 없이 직접 구성
+        # (필드를 추가하면 여기와 from_dict 입력에도 반영)
+        data = {
+            'host': self.host,
+            'username': self.username,
+            'password': self.password,
+            'id': self.id,
+            'name': self.name,
+            'port': self.port,
+            'group': self.group,
+            'description': self.description,
+        }
         if not include_password:
             data.pop('password', None)
         return data
@@ -91,7 +138,8 @@ def get_app_directory() -> Path:
 class ServerManager:
     """서버 목록을 암호화하여 관리하는 클래스"""
     
-    CONFIG_VERSION = 1
+    # 2: 비밀번호를 AES-GCM으로 암호화 (1: Fernet, 읽을 때 자동 변환)
+    CONFIG_VERSION = 2
     VERIFICATION_TEXT = "ssh_manager_verification_string"
     
     def __init__(self, config_dir: Path = None):
@@ -106,8 +154,16 @@ class ServerManager:
         self.config_dir = Path(config_dir)
         self.servers_file = self.config_dir / "servers.json"
         self.crypto = CryptoManager(self.config_dir)
-        self._servers: list[Server] = []
+        self._servers: dict[str, Server] = {}   # ID → 서버 (등록 순서 유지)
+        self._by_name: dict[str, Server] = {}   # 이름 → 서버 (같은 이름이면 먼저 등록된 서버)
         self._loaded = False
+        self._dirty = False         # 저장되지 않은 변경 여부
+        self._batch_depth = 0       # batch() 중첩 수 (0보다 크면 저장 보류)
+        
+        # 저장 시 재암호화 생략용: 서버 ID → (평문 비밀번호, 암호문)
+        # (서버별로 보관하여 같은 비밀번호를 쓰는 서버끼리 암호문이 같아지지 않게 함)
+        self._pw_cache: dict[str, tuple[str, str]] = {}
+        self._verification_ct: Optional[str] = None
     
     def initialize(self, master_password: str, is_new: bool = False) -> bool:
         """
@@ -123,15 +179,28 @@ class ServerManager:
         if not self.crypto.initialize(master_password):
             return False
         
+        # 키가 바뀌었을 수 있으므로 이전 암호문 재사용 안 함
+        self._pw_cache.clear()
+        self._verification_ct = None
+        
         if is_new:
             # 새로운 설정 파일 생성
-            self._servers = []
+            self._set_servers([])
             self._save()
             return True
         
         # 기존 설정 로드 및 비밀번호 검증
         return self._load()
     
+    def check_config(self) -> tuple[bool, str]:
+        """
+        기존 설정의 암호화 설정 파일 확인 (손상되었으면 비밀번호를 물어도 열 수 없음)
+        
+        Returns:
+            (정상 여부, 오류 메시지)
+        """
+        return self.crypto.check_kdf_file()
+    
     def is_first_run(self) -> bool:
         """처음 실행 여부"""
         return not self.servers_file.exists()
@@ -144,36 +213,76 @@ class ServerManager:
             로드 성공 여부 (마스터 비밀번호 검증 포함)
         """
         if not self.servers_file.exists():
-            self._servers = []
+            self._set_servers([])
             self._loaded = True
             return True
         
         try:
-            with open(self.servers_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(self.servers_file.read_bytes())
             
-            # 마스터 비밀번호 검증
+            # 마스터 비밀번호 검증 (검증용 토큰의 HMAC만 확인)
             verification = data.get('verification', '')
             if verification:
-                decrypted = self.crypto.decrypt(verification)
-                if decrypted != self.VERIFICATION_TEXT:
+                if not self.crypto.verify_password(verification):
                     return False
+                if not self.crypto.is_legacy(verification):
+                    self._verification_ct = verification
+            
+            # 서버 목록 로드 및 비밀번호 복호화 (암호문은 모아서 한 번에 복호화)
+            servers_data = data.get('servers', [])
+            ciphertexts = [
+                server_data['password'] for server_data in servers_data
+                if server_data.get('password')
+            ]
+            passwords = iter(self.crypto.decrypt_many(ciphertexts))
             
-            # 서버 목록 로드 및 비밀번호 복호화
-            self._servers = []
-            for server_data in data.get('servers', []):
-                # 비밀번호 복호화
-                if 'password' in server_data and server_data['password']:
-                    server_data['password'] = self.crypto.decrypt(server_data['password'])
-                
-                self._servers.append(Server.from_dict(server_data))
+            servers = []
+            for server_data in servers_data:
+                ciphertext = server_data.get('password')
+                if ciphertext:
+                    server_data['password'] = next(passwords)
+                server = Server.from_dict(server_data)
+                if ciphertext and not self.crypto.is_legacy(ciphertext):
+                    # 암호문은 다음 저장 때 재사용
+                    self._pw_cache[server.id] = (server.password, ciphertext)
+                servers.append(server)
+            self._set_servers(servers)
             
             self._loaded = True
+            
+            # 이전 형식(Fernet) 암호문이 있으면 AES-GCM으로 다시 저장
+            # (실패해도 읽기는 계속 가능하고 다음 저장 때 변환됨)
+            if self._verification_ct is None or any(map(self.crypto.is_legacy, ciphertexts)):
+                try:
+                    self._save()
+                except OSError:
+                    pass
             return True
             
         except (json.JSONDecodeError, ValueError, KeyError):
             return False
     
+    def _set_servers(self, servers: list[Server]) -> None:
+        """서버 목록 교체 및 ID/이름 색인 재생성"""
+        self._servers = {server.id: server for server in servers}
+        self._by_name = {}
+        for server in servers:
+            self._by_name.setdefault(server.name, server)
+    
+    def _unindex_name(self, server: Server, name: str) -> None:
+        """
+        이름 색인에서 서버 제거
+        
+        같은 이름의 다른 서버가 있으면 그중 먼저 등록된 서버로 색인을 채웁니다.
+        """
+        if self._by_name.get(name) is not server:
+            return
+        del self._by_name[name]
+        for other in self._servers.values():
+            if other.name == name and other is not server:
+                self._by_name[name] = other
+                break
+    
     def _save(self) -> None:
         """서버 목록을 암호화하여 저장"""
         if not self.crypto.is_initialized:
@@ -181,30 +290,94 @@ class ServerManager:
         
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        # 비밀번호 암호화
+        # 비밀번호 암호화 (바뀌지 않은 비밀번호는 이전 암호문 재사용)
+        # 새로 암호화할 비밀번호는 모아서 encrypt_many 한 번으로 처리
         servers_data = []
-        for server in self._servers:
+        pw_cache = {}
+        pending = []  # (서버 dict, 서버 ID, 평문)
+        for server in self._servers.values():
             data = server.to_dict()
-            if data['password']:
-                data['password'] = self.crypto.encrypt(data['password'])
+            password = data['password']
+            if password:
+                cached = self._pw_cache.get(server.id)
+                if cached is not None and cached[0] == password:
+                    pw_cache[server.id] = cached
+                    data['password'] = cached[1]
+                else:
+                    pending.append((data, server.id, password))
             servers_data.append(data)
         
+        if pending:
+            ciphertexts = self.crypto.encrypt_many([password for _, _, password in pending])
+            for (data, server_id, password), ciphertext in zip(pending, ciphertexts):
+                pw_cache[server_id] = (password, ciphertext)
+                data['password'] = ciphertext
+        self._pw_cache = pw_cache  # 삭제된 서버 항목은 버림
+        
+        if self._verification_ct is None:
+            self._verification_ct = self.crypto.encrypt(self.VERIFICATION_TEXT)
+        
         config = {
             'version': self.CONFIG_VERSION,
-            'verification': self.crypto.encrypt(self.VERIFICATION_TEXT),
+            'verification': self._verification_ct,
             'servers': servers_data
         }
         
-        with open(self.servers_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # 임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 기존 파일은 온전함)
+        # 임시 파일은 처음부터 소유자만 읽기/쓰기 권한으로 생성
+        temp_file = self.servers_file.with_suffix('.tmp')
+        write_private_file(temp_file, _dumps(config), sync=True)
+        os.replace(temp_file, self.servers_file)
+        self._dirty = False
+    
+    def _changed(self) -> None:
+        """변경 기록 후 저장 (batch() 안에서는 블록이 끝날 때 한 번만 저장)"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save()
+    
+    def flush(self) -> None:
+        """저장되지 않은 변경이 있으면 저장"""
+        if self._dirty:
+            self._save()
+    
+    def close(self) -> None:
+        """남은 변경을 저장하고 암호화 키를 메모리에서 정리"""
+        if self.crypto.is_initialized:
+            self.flush()
+        self.crypto.close()
+    
+    @contextmanager
+    def batch(self):
+        """
+        여러 변경을 모아 한 번에 저장
+        
+        사용 예:
+            with manager.batch():
+                for server in servers:
+                    manager.add_server(server)
         
-        # 파일 권한 제한 (소유자만 읽기/쓰기)
-        self.servers_file.chmod(0o600)
+        변경마다 전체 목록을 암호화/저장하지 않고 블록이 끝날 때 한 번만 저장합니다.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
     
     def add_server(self, server: Server) -> None:
         """서버 추가"""
-        self._servers.append(server)
-        self._save()
+        self._servers[server.id] = server
+        self._by_name.setdefault(server.name, server)
+        self._changed()
+    
+    def add_servers(self, servers: list[Server]) -> None:
+        """서버 여러 개 추가 (저장은 한 번)"""
+        with self.batch():
+            for server in servers:
+                self.add_server(server)
     
     def remove_server(self, server_id: str) -> bool:
         """
@@ -216,12 +389,13 @@ class ServerManager:
         Returns:
             삭제 성공 여부
         """
-        for i, server in enumerate(self._servers):
-            if server.id == server_id:
-                del self._servers[i]
-                self._save()
-                return True
-        return False
+        server = self._servers.pop(server_id, None)
+        if server is None:
+            return False
+        
+        self._unindex_name(server, server.name)
+        self._changed()
+        return True
     
     def update_server(self, server_id: str, **kwargs) -> bool:
         """
@@ -234,28 +408,31 @@ class ServerManager:
         Returns:
             수정 성공 여부
         """
-        for server in self._servers:
-            if server.id == server_id:
-                for key, value in kwargs.items():
-                    if hasattr(server, key):
-                        setattr(server, key, value)
-                self._save()
-                return True
-        return False
+        server = self._servers.get(server_id)
+        if server is None:
+            return False
+        
+        old_name = server.name
+        for key, value in kwargs.items():
+            if hasattr(server, key):
+                setattr(server, key, value)
+        server.refresh_search_blob()
+        
+        # 이름이 바뀌면 이름 색인 갱신
+        if server.name != old_name:
+            self._unindex_name(server, old_name)
+            self._by_name.setdefault(server.name, server)
+        
+        self._changed()
+        return True
     
     def get_server(self, server_id: str) -> Optional[Server]:
         """ID로 서버 조회"""
-        for server in self._servers:
-            if server.id == server_id:
-                return server
-        return None
+        return self._servers.get(server_id)
     
     def get_server_by_name(self, name: str) -> Optional[Server]:
         """이름으로 서버 조회"""
-        for server in self._servers:
-            if server.name == name:
-                return server
-        return None
+        return self._by_name.get(name)
     
     def list_servers(self, group: str = None) -> list[Server]:
         """
@@ -265,12 +442,12 @@ class ServerManager:
             group: 필터링할 그룹 (None이면 전체)
         """
         if group is None:
-            return list(self._servers)
-        return [s for s in self._servers if s.group == group]
+            return list(self._servers.values())
+        return [s for s in self._servers.values() if s.group == group]
     
     def list_groups(self) -> list[str]:
         """그룹 목록 조회"""
-        groups = set(s.group for s in self._servers)
+        groups = set(s.group for s in self._servers.values())
         return sorted(groups)
     
     def search_servers(self, query: str) -> list[Server]:
@@ -281,13 +458,7 @@ class ServerManager:
             query: 검색어
         """
         query = query.lower()
-        results = []
-        for server in self._servers:
-            if (query in server.name.lower() or 
-                query in server.host.lower() or 
-                query in server.description.lower()):
-                results.append(server)
-        return results
+        return [s for s in self._servers.values() if query in s._search_blob]
     
     @property
     def server_count(self) -> int:
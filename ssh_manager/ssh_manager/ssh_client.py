@@ -16,17 +16,44 @@ SSH 클라이언트 모듈 - SSH 연결 및 명령 실행 관리
 - 일부 고급 SSH 기능 미지원
 """
 
+import select
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Callable, Optional
-from queue import Queue, Empty
+from typing import Callable, Iterable, Iterator, Optional
 import paramiko
 from paramiko import SSHClient, AutoAddPolicy, AuthenticationException, SSHException
 
 from .server import Server
 
 
+# 우선 협상할 암호 알고리즘
+# AES-GCM은 cryptography(OpenSSL)의 AES-NI 경로로 암호화와 무결성 검사를 한 번에 처리
+# (CTR + HMAC 조합처럼 패킷마다 MAC을 따로 계산하지 않음)
+PREFERRED_CIPHERS = ('aes128-gcm@openssh.com', 'aes256-gcm@openssh.com')
+
+
+def prefer_fast_ciphers(transport: paramiko.Transport) -> None:
+    """
+    Transport의 암호 협상 순서에서 PREFERRED_CIPHERS를 맨 앞으로 이동
+    
+    나머지 암호는 순서대로 뒤에 남겨 두므로 GCM을 지원하지 않는 서버와도 접속됩니다.
+    (연결 전에 호출해야 함)
+    """
+    options = transport.get_security_options()
+    current = options.ciphers
+    preferred = tuple(c for c in PREFERRED_CIPHERS if c in current)
+    options.ciphers = preferred + tuple(c for c in current if c not in preferred)
+
+
+def create_transport(sock, **kwargs) -> paramiko.Transport:
+    """SSHClient.connect의 transport_factory용 (빠른 암호 우선 Transport 생성)"""
+    transport = paramiko.Transport(sock, **kwargs)
+    prefer_fast_ciphers(transport)
+    return transport
+
+
 @dataclass
 class CommandResult:
     """명령 실행 결과를 담는 데이터 클래스"""
@@ -82,6 +109,7 @@ class SSHConnection:
                     timeout=self.timeout,
                     allow_agent=False,      # SSH 에이전트 사용 안함
                     look_for_keys=False,    # 로컬 키 파일 검색 안함
+                    transport_factory=create_transport,
                 )
                 
                 self._connected = True
@@ -142,9 +170,10 @@ class SSHConnection:
                 timeout=timeout or self.timeout
             )
             
-            # 출력 읽기
-            stdout_text = stdout.read().decode('utf-8', errors='replace')
-            stderr_text = stderr.read().decode('utf-8', errors='replace')
+            # 출력 읽기 (stdout/stderr 동시 수집)
+            stdout_data, stderr_data = self._read_output(stdout.channel, timeout or self.timeout)
+            stdout_text = stdout_data.decode('utf-8', errors='replace')
+            stderr_text = stderr_data.decode('utf-8', errors='replace')
             exit_code = stdout.channel.recv_exit_status()
             
             execution_time = time.time() - start_time
@@ -171,6 +200,55 @@ class SSHConnection:
                 execution_time=time.time() - start_time
             )
     
+    @staticmethod
+    def _read_output(channel: paramiko.Channel, timeout: float) -> tuple[bytearray, bytearray]:
+        """
+        채널의 stdout/stderr를 EOF까지 번갈아 읽기
+        
+        구현 방식:
+        - select로 채널에 데이터가 올 때까지 대기하고 온 쪽부터 즉시 비움
+        - stdout을 다 읽은 뒤 stderr를 읽는 순차 방식과 달리 한쪽 출력이 많아도
+          다른 쪽 버퍼가 차서 원격 전송이 멈추는 일이 없음
+        - bytearray에 이어 붙이고 디코딩은 마지막에 한 번만
+        - EOF를 본 뒤에도 양쪽 버퍼를 한 번 더 비워 마지막 출력이 잘리지 않게 함
+        
+        Args:
+            channel: exec_command로 연 채널
+            timeout: 출력 없이 기다릴 최대 시간 (초)
+            
+        Returns:
+            (stdout 바이트, stderr 바이트)
+        """
+        stdout_data = bytearray()
+        stderr_data = bytearray()
+        
+        while True:
+            received = False
+            if channel.recv_ready():
+                stdout_data.extend(channel.recv(65536))
+                received = True
+            if channel.recv_stderr_ready():
+                stderr_data.extend(channel.recv_stderr(65536))
+                received = True
+            if received:
+                continue
+            
+            # EOF(또는 채널 종료)면 더 올 출력 없음
+            # 위에서 버퍼를 확인한 뒤 EOF 확인 사이에 마지막 출력이 도착했을 수 있으므로
+            # 양쪽 버퍼를 한 번 더 비우고 끝냄 (출력 끝부분 유실 방지)
+            if channel.eof_received or channel.closed:
+                while channel.recv_ready():
+                    stdout_data.extend(channel.recv(65536))
+                while channel.recv_stderr_ready():
+                    stderr_data.extend(channel.recv_stderr(65536))
+                break
+            
+            readable, _, _ = select.select([channel], [], [], timeout)
+            if not readable:
+                raise TimeoutError(f"명령 타임아웃: {timeout}초 동안 출력 없음")
+        
+        return stdout_data, stderr_data
+    
     def get_shell(self) -> Optional[paramiko.Channel]:
         """
         인터랙티브 쉘 채널 반환
@@ -209,9 +287,63 @@ class SSHConnection:
 class MultiSSHManager:
     """다중 SSH 연결 관리 및 병렬 명령 실행 클래스"""
     
+    # 명령 실행 스레드 풀 크기 상한
+    MAX_WORKERS = 128
+    
     def __init__(self):
         self._connections: dict[str, SSHConnection] = {}
         self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """명령 실행 스레드 풀 반환 (처음 사용할 때 생성, 이후 재사용)"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.MAX_WORKERS,
+                    thread_name_prefix='ssh-exec'
+                )
+            return self._pool
+    
+    def _execute_on(
+        self,
+        connections: Iterable[SSHConnection],
+        command: str,
+        callback: Callable[[CommandResult], None] = None,
+        timeout: int = 30
+    ) -> list[CommandResult]:
+        """
+        주어진 연결들에 명령 동시 실행
+        
+        구현 방식:
+        - 매니저가 가진 스레드 풀에 작업 제출 (명령마다 스레드 생성/종료 없음)
+        - 완료된 순서대로 결과를 모으고 콜백 호출
+        """
+        results = []
+        for result in self._iter_execute_on(connections, command, timeout):
+            results.append(result)
+            if callback:
+                callback(result)
+        return results
+    
+    def _iter_execute_on(
+        self,
+        connections: Iterable[SSHConnection],
+        command: str,
+        timeout: int = 30
+    ) -> Iterator[CommandResult]:
+        """
+        주어진 연결들에 명령을 한꺼번에 제출하고 끝나는 순서대로 결과를 하나씩 반환
+        
+        구현 방식:
+        - 모든 작업을 먼저 스레드 풀에 제출한 뒤 as_completed로 완료된 것부터 yield
+        - 호출 측은 가장 느린 서버를 기다리지 않고 먼저 끝난 결과부터 처리 가능
+        """
+        pool = self._get_pool()
+        futures = [pool.submit(conn.execute, command, timeout) for conn in connections]
+        
+        for future in as_completed(futures):
+            yield future.result()
     
     def add_connection(self, server: Server) -> tuple[bool, str]:
         """
@@ -256,8 +388,8 @@ class MultiSSHManager:
         모든 연결된 서버에 명령 동시 실행
         
         구현 방식: 스레드 풀 사용
-        - 각 서버마다 별도 스레드에서 명령 실행
-        - Queue를 통해 결과 수집
+        - 각 서버의 명령을 매니저의 스레드 풀에서 실행
+        - 완료된 순서대로 결과 수집
         - 콜백으로 실시간 결과 전달 가능
         
         Args:
@@ -268,35 +400,7 @@ class MultiSSHManager:
         Returns:
             모든 서버의 실행 결과 리스트
         """
-        results = []
-        result_queue = Queue()
-        threads = []
-        
-        def execute_task(conn: SSHConnection):
-            result = conn.execute(command, timeout)
-            result_queue.put(result)
-            if callback:
-                callback(result)
-        
-        # 모든 연결에 대해 스레드 생성
-        for conn in self._connections.values():
-            thread = threading.Thread(target=execute_task, args=(conn,))
-            thread.start()
-            threads.append(thread)
-        
-        # 모든 스레드 완료 대기
-        for thread in threads:
-            thread.join()
-        
-        # 결과 수집
-        while True:
-            try:
-                result = result_queue.get_nowait()
-                results.append(result)
-            except Empty:
-                break
-        
-        return results
+        return self._execute_on(list(self._connections.values()), command, callback, timeout)
     
     def execute_on_selected(
         self,
@@ -314,41 +418,47 @@ class MultiSSHManager:
             callback: 결과 콜백
             timeout: 타임아웃
         """
-        results = []
-        result_queue = Queue()
-        threads = []
-        
-        def execute_task(conn: SSHConnection):
-            result = conn.execute(command, timeout)
-            result_queue.put(result)
-            if callback:
-                callback(result)
-        
-        for server_id in server_ids:
-            if server_id in self._connections:
-                conn = self._connections[server_id]
-                thread = threading.Thread(target=execute_task, args=(conn,))
-                thread.start()
-                threads.append(thread)
-        
-        for thread in threads:
-            thread.join()
-        
-        while True:
-            try:
-                result = result_queue.get_nowait()
-                results.append(result)
-            except Empty:
-                break
+        targets = [
+            self._connections[server_id]
+            for server_id in server_ids
+            if server_id in self._connections
+        ]
+        return self._execute_on(targets, command, callback, timeout)
+    
+    def execute_iter(
+        self,
+        server_ids: list[str],
+        command: str,
+        timeout: int = 30
+    ) -> Iterator[CommandResult]:
+        """
+        선택한 서버들에 명령 실행 후 완료되는 순서대로 결과 반환 (스트리밍용)
         
-        return results
+        Args:
+            server_ids: 대상 서버 ID 목록
+            command: 실행할 명령어
+            timeout: 타임아웃
+            
+        Returns:
+            CommandResult 이터레이터 (먼저 끝난 서버부터)
+        """
+        targets = [
+            self._connections[server_id]
+            for server_id in server_ids
+            if server_id in self._connections
+        ]
+        return self._iter_execute_on(targets, command, timeout)
     
     def disconnect_all(self) -> None:
-        """모든 연결 종료"""
+        """모든 연결 종료 (명령 실행 스레드 풀도 종료, 다음 실행 시 다시 생성)"""
         with self._lock:
             for conn in self._connections.values():
                 conn.disconnect()
             self._connections.clear()
+            
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
     
     @property
     def connected_servers(self) -> list[Server]:
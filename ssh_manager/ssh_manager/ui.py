@@ -17,9 +17,12 @@ import os
 import sys
 import time
 import getpass
+import functools
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
@@ -27,45 +30,138 @@ from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeEl
 from rich.live import Live
 from rich.layout import Layout
 from rich.text import Text
+from rich.style import Style
 from rich import box
 
+from .crypto import write_private_file
 from .server import Server, ServerManager
 from .ssh_client import MultiSSHManager, CommandResult, SSHConnection
-from .file_transfer import MultiFileTransfer, TransferResult, TransferProgress, format_size, format_speed
-from .multi_terminal import launch_multi_terminal, check_dependencies, is_tmux_available, TEXTUAL_AVAILABLE
+from .file_transfer import (
+    MultiFileTransfer, TransferResult, TransferProgress,
+    close_cached_transports, format_size, format_speed,
+)
 
 
 # 콘솔 인스턴스 (전역)
 console = Console()
 
+# 명령 히스토리 (실행할 명령 입력에만 사용, 설정 디렉토리에 저장)
+HISTORY_FILE_NAME = "history"
+HISTORY_LENGTH = 1000
+
+# readline 설정 (히스토리, 자동완성) - 모듈 로드 시 한 번만
+try:
+    import readline
+    readline.parse_and_bind('tab: complete')
+    readline.parse_and_bind('set editing-mode emacs')
+    readline.set_history_length(HISTORY_LENGTH)
+    _HAS_READLINE = True
+except ImportError:
+    _HAS_READLINE = False  # Windows에서는 readline이 없을 수 있음
+
+# 결과 표시에 쓰는 미리 만든 스타일/텍스트 (출력할 때마다 마크업을 해석하지 않음)
+_STYLE_OK = Style(color="green")
+_STYLE_FAIL = Style(color="red")
+_STYLE_DIM = Style(dim=True)
+_TEXT_SUCCESS = Text("SUCCESS", style=_STYLE_OK)
+_TEXT_FAILED = Text("FAILED", style=_STYLE_FAIL)
+_TEXT_TRANSFER_OK = Text("성공", style=_STYLE_OK)
+_TEXT_TRANSFER_FAIL = Text("실패", style=_STYLE_FAIL)
+_TEXT_NO_OUTPUT = Text("(출력 없음)", style=_STYLE_DIM)
+_NEWLINE = Text("\n")
+_TEXT_MARK_OK = Text("V", style=_STYLE_OK)
+_TEXT_MARK_FAIL = Text("X", style=_STYLE_FAIL)
+_TEXT_MARK_WAIT = Text("-", style=_STYLE_DIM)
+_TEXT_CONNECTED = Text("연결됨")
+
+
+# POSIX 터미널 여부 (import 시 한 번만 판별)
+_POSIX = os.name != 'nt'
+
+# 커서를 맨 위로 옮기고 화면과 스크롤백까지 지우는 ANSI 시퀀스 ('clear'와 같은 효과)
+_CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
 
 def clear_screen():
-    """화면 지우기"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    """
+    화면 지우기
+    
+    POSIX에서는 'clear' 프로세스를 띄우지 않고 ANSI 시퀀스를 직접 출력
+    """
+    if _POSIX:
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+
+# 화면 상단 헤더 (내용이 고정이므로 import 시 한 번만 생성)
+_HEADER = Panel(
+    Text("SSH Manager v1.0", style="bold cyan", justify="center"),
+    subtitle="Multi-Server SSH Management Tool",
+    box=box.DOUBLE
+)
+
+# 메뉴 항목: (키, 설명) 튜플
+MAIN_MENU_OPTIONS = (
+    ("1", "서버 관리 (추가/수정/삭제)"),
+    ("2", "서버 목록 보기"),
+    ("3", "서버 연결 (명령 브로드캐스트용)"),
+    ("4", "명령 실행 (연결된 서버에)"),
+    ("5", "파일 전송 (연결된 서버에)"),
+    ("6", "연결 해제"),
+    ("7", "멀티 터미널 (분할 화면)"),
+    ("q", "종료"),
+)
+SERVER_MENU_OPTIONS = (
+    ("1", "서버 추가"),
+    ("2", "서버 수정"),
+    ("3", "서버 삭제"),
+    ("b", "뒤로 가기"),
+)
+TRANSFER_MENU_OPTIONS = (
+    ("1", "파일/폴더 업로드 (로컬 -> 원격)"),
+    ("2", "파일 다운로드 (단일 서버)"),
+    ("3", "폴더 다운로드 (여러 서버 -> IP별 zip)"),
+    ("b", "뒤로 가기"),
+)
+
+# 메뉴 선택 프롬프트 (Prompt.ask("선택", default="q")와 같은 모양, 빈 입력은 q)
+_MENU_PROMPT = "선택 \033[1;36m(q)\033[0m: "
 
 
 def print_header():
     """헤더 출력"""
-    header = Panel(
-        Text("SSH Manager v1.0", style="bold cyan", justify="center"),
-        subtitle="Multi-Server SSH Management Tool",
-        box=box.DOUBLE
-    )
-    console.print(header)
+    console.print(_HEADER)
     console.print()
 
 
-def print_menu(title: str, options: list[tuple[str, str]]) -> str:
+def print_menu(title: str, options: tuple[tuple[str, str], ...]) -> str:
     """
     메뉴 출력 및 선택 받기
     
     Args:
         title: 메뉴 제목
-        options: (키, 설명) 튜플 리스트
+        options: (키, 설명) 튜플들 (캐시 키로 쓰이므로 tuple)
         
     Returns:
         선택된 키
     """
+    console.print(_build_menu_table(title, options))
+    console.print()
+    
+    # 메뉴 선택은 미리 만든 프롬프트로 input()만 호출 (Prompt 객체 생성/마크업 해석 생략)
+    valid_keys = frozenset(opt[0].lower() for opt in options)
+    while True:
+        choice = input(_MENU_PROMPT).strip().lower() or "q"
+        if choice in valid_keys:
+            return choice
+        console.print("[red]잘못된 선택입니다. 다시 입력하세요.[/red]")
+
+
+@functools.lru_cache(maxsize=8)
+def _build_menu_table(title: str, options: tuple[tuple[str, str], ...]) -> Table:
+    """메뉴 테이블 생성 (같은 메뉴는 만들어 둔 테이블 재사용)"""
     table = Table(
         title=title,
         box=box.ROUNDED,
@@ -76,18 +172,54 @@ def print_menu(title: str, options: list[tuple[str, str]]) -> str:
     table.add_column("Description", style="white")
     
     for key, desc in options:
-        # rich 마크업 이스케이프: [b]는 bold로 해석되므로 \[ 사용
+        # rich 마크업 이스케이프: [b]는 bold로 해석되므로 \\[ 사용
         table.add_row(f"\\[{key}]", desc)
     
-    console.print(table)
-    console.print()
+    return table
+
+
+def _parse_selection(selection: str, items: list, kind: str = "서버") -> list:
+    """
+    번호 선택 입력 해석 ('all' 또는 쉼표로 구분한 1부터 시작하는 번호)
     
-    valid_keys = [opt[0].lower() for opt in options]
-    while True:
-        choice = Prompt.ask("선택", default="q").lower().strip()
-        if choice in valid_keys:
-            return choice
-        console.print("[red]잘못된 선택입니다. 다시 입력하세요.[/red]")
+    구현 방식:
+    - 잘못된 번호(숫자가 아니거나 범위 밖)는 모아서 한 번만 알리고 무시
+    - 같은 번호를 여러 번 입력해도 한 번만 선택 (입력 순서 유지)
+    
+    Args:
+        selection: 사용자 입력
+        items: 선택 대상 목록
+        kind: 안내 메시지에 표시할 대상 이름
+        
+    Returns:
+        선택된 항목 리스트 (없으면 빈 리스트)
+    """
+    selection = selection.strip()
+    if not selection:
+        return []
+    if selection.lower() == "all":
+        return list(items)
+    
+    indices = []
+    invalid = []
+    for token in selection.split(","):
+        token = token.strip()
+        if not token:
+            continue
+        try:
+            index = int(token) - 1
+        except ValueError:
+            invalid.append(token)
+            continue
+        if 0 <= index < len(items):
+            indices.append(index)
+        else:
+            invalid.append(token)
+    
+    if invalid:
+        console.print(Text(f"잘못된 {kind} 번호는 무시합니다: {', '.join(invalid)}", style="yellow"))
+    
+    return [items[i] for i in dict.fromkeys(indices)]
 
 
 def print_servers_table(servers: list[Server], show_index: bool = False, title: str = "서버 목록"):
@@ -96,64 +228,137 @@ def print_servers_table(servers: list[Server], show_index: bool = False, title:
         console.print(Panel("[yellow]등록된 서버가 없습니다.[/yellow]", title=title))
         return
     
+    rows = tuple(
+        (
+            server.name,
+            server.host,
+            str(server.port),
+            server.username,
+            server.group,
+            server.description[:30] + "..." if len(server.description) > 30 else server.description
+        )
+        for server in servers
+    )
+    console.print(_build_servers_table(rows, show_index, title))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_servers_table(rows: tuple, show_index: bool, title: str) -> Table:
+    """
+    서버 목록 테이블 생성
+    
+    구현 방식:
+    - 행 내용(문자열 튜플)이 같으면 만들어 둔 테이블 재사용 (메뉴를 다시 그릴 때마다 새로 만들지 않음)
+    - 셀은 Text로 넣어 마크업 해석 생략 (서버 이름의 '[' 등이 그대로 표시됨)
+    
+    Args:
+        rows: (이름, 호스트, 포트, 사용자, 그룹, 설명) 튜플들
+        show_index: 번호 열 표시 여부
+        title: 테이블 제목
+    """
     table = Table(title=title, box=box.ROUNDED)
     
     if show_index:
-        table.add_column("#", style="dim", width=4)
+        table.add_column("#", style="dim", width=4, no_wrap=True)
     table.add_column("이름", style="cyan", no_wrap=True)
     table.add_column("호스트", style="green")
-    table.add_column("포트", style="yellow", justify="right")
+    table.add_column("포트", style="yellow", justify="right", no_wrap=True)
     table.add_column("사용자", style="blue")
     table.add_column("그룹", style="magenta")
     table.add_column("설명", style="dim")
     
-    for i, server in enumerate(servers, 1):
-        row = []
+    for i, row in enumerate(rows, 1):
+        cells = [Text(value) for value in row]
         if show_index:
-            row.append(str(i))
-        row.extend([
-            server.name,
-            server.host,
-            str(server.port),
-            server.username,
-            server.group,
-            server.description[:30] + "..." if len(server.description) > 30 else server.description
-        ])
-        table.add_row(*row)
+            cells.insert(0, Text(str(i)))
+        table.add_row(*cells)
     
-    console.print(table)
+    return table
 
 
 def print_command_results(results: list[CommandResult]):
-    """명령 실행 결과 출력"""
+    """
+    명령 실행 결과 출력
+    
+    서버별 패널을 모아 console.print 한 번으로 출력 (서버마다 출력/flush 하지 않음)
+    """
+    if not results:
+        return
+    
+    renderables = []
     for result in results:
-        if result.success:
-            status = "[green]SUCCESS[/green]"
-        else:
-            status = "[red]FAILED[/red]"
-        
-        title = f"{result.server.name} ({result.server.host}) - {status}"
-        
-        content = []
-        if result.stdout:
-            content.append(result.stdout.rstrip())
-        if result.stderr:
-            content.append(f"[red]{result.stderr.rstrip()}[/red]")
-        if result.error_message:
-            content.append(f"[red]Error: {result.error_message}[/red]")
-        
-        if not content:
-            content.append("[dim](출력 없음)[/dim]")
-        
-        panel = Panel(
-            "\n".join(content),
-            title=title,
-            title_align="left",
-            border_style="green" if result.success else "red",
-            box=box.ROUNDED
-        )
-        console.print(panel)
-        console.print()
+        renderables.append(build_result_panel(result))
+        renderables.append("")  # 패널 사이 빈 줄
+    
+    console.print(Group(*renderables))
+
+
+def build_result_panel(result: CommandResult) -> Panel:
+    """서버 하나의 명령 실행 결과 패널 생성"""
+    status = _TEXT_SUCCESS if result.success else _TEXT_FAILED
+    title = Text.assemble(f"{result.server.name} ({result.server.host}) - ", status)
+    
+    # 원격 출력은 Text로 감싸 마크업으로 해석하지 않음 ('[' 등이 그대로 표시됨)
+    content = []
+    if result.stdout:
+        content.append(Text(result.stdout.rstrip()))
+    if result.stderr:
+        content.append(Text(result.stderr.rstrip(), style=_STYLE_FAIL))
+    if result.error_message:
+        content.append(Text(f"Error: {result.error_message}", style=_STYLE_FAIL))
+    
+    body = _NEWLINE.join(content) if content else _TEXT_NO_OUTPUT
+    
+    return Panel(
+        body,
+        title=title,
+        title_align="left",
+        border_style=_STYLE_OK if result.success else _STYLE_FAIL,
+        box=box.ROUNDED
+    )
+
+
+def _new_results_grid() -> Table:
+    """진행 표시 아래에 서버별 결과를 한 줄씩 쌓는 표 (표시 / 서버 / 상태)"""
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(no_wrap=True)
+    grid.add_column(style="cyan", no_wrap=True)
+    grid.add_column()
+    return grid
+
+
+class _UploadTally:
+    """
+    업로드 중 서버별 성공/실패 파일 수 (진행 표시 아래에 서버당 한 줄로 표시)
+    
+    폴더 업로드는 파일마다 결과가 오므로 결과마다 행을 쌓지 않고 개수만 갱신합니다.
+    (Live가 다시 그릴 때마다 서버 수만큼의 행만 만듦, 파일별 결과는 끝난 뒤 표로 출력)
+    """
+    
+    def __init__(self, servers: list[Server]):
+        # 서버 ID → [이름, 성공 수, 실패 수]
+        self._counts = {server.id: [server.name, 0, 0] for server in servers}
+    
+    def add(self, result: TransferResult) -> None:
+        """전송 결과 하나 반영"""
+        counts = self._counts[result.server.id]
+        counts[1 if result.success else 2] += 1
+    
+    def __rich__(self) -> Table:
+        grid = _new_results_grid()
+        for name, ok, failed in self._counts.values():
+            if failed:
+                mark = _TEXT_MARK_FAIL
+            elif ok:
+                mark = _TEXT_MARK_OK
+            else:
+                mark = _TEXT_MARK_WAIT
+            grid.add_row(mark, name, Text.assemble(
+                (f"성공 {ok}", _STYLE_OK),
+                "  ",
+                (f"실패 {failed}", _STYLE_FAIL if failed else _STYLE_DIM),
+            ))
+        return grid
 
 
 def print_transfer_results(results: list[TransferResult]):
@@ -167,11 +372,11 @@ def print_transfer_results(results: list[TransferResult]):
     
     for result in results:
         if result.success:
-            status = "[green]성공[/green]"
+            status = _TEXT_TRANSFER_OK
             message = ""
         else:
-            status = "[red]실패[/red]"
-            message = result.error_message[:40]
+            status = _TEXT_TRANSFER_FAIL
+            message = Text(result.error_message[:40])
         
         table.add_row(
             f"{result.server.name}",
@@ -192,6 +397,45 @@ class SSHManagerUI:
         self.ssh_manager = MultiSSHManager()
         self.file_transfer = MultiFileTransfer()
         self._running = True
+        
+        # 화면마다 새로 만들지 않고 재사용하는 진행률 표시 (갱신 주기 초당 4회)
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            console=console,
+            refresh_per_second=4
+        )
+    
+    @contextmanager
+    def _progress_task(self, description: str, total: float, footer: RenderableType = None):
+        """
+        공용 Progress에 작업 하나를 추가해 표시하고 끝나면 제거
+        
+        구현 방식:
+        - footer가 없으면 Progress 자체의 Live로 표시
+        - footer가 있으면 진행률과 footer를 한 Live에 묶어 같은 주기로 다시 그림
+          (footer 내용만 바꾸면 되고 console.print로 끼워 넣지 않음)
+        
+        사용 예:
+            with self._progress_task("전송 중...", total=10) as (progress, task):
+                progress.advance(task)
+        """
+        progress = self._progress
+        task = progress.add_task(description, total=total)
+        display = progress if footer is None else Live(
+            Group(progress, footer),
+            console=console,
+            refresh_per_second=4
+        )
+        display.start()
+        try:
+            yield progress, task
+        finally:
+            display.stop()
+            progress.remove_task(task)
     
     def run(self):
         """메인 루프 실행"""
@@ -208,6 +452,8 @@ class SSHManagerUI:
         
         # 정리
         self.ssh_manager.disconnect_all()
+        close_cached_transports()
+        self.server_manager.close()
         console.print("\n[cyan]SSH Manager를 종료합니다. 안녕히 가세요![/cyan]\n")
     
     def _initialize(self) -> bool:
@@ -242,6 +488,13 @@ class SSHManagerUI:
                 console.print("[red]초기화에 실패했습니다.[/red]")
                 return False
         else:
+            # 설정 파일이 손상되었으면 비밀번호를 묻지 않고 종료
+            ok, error = self.server_manager.check_config()
+            if not ok:
+                console.print(Text(error, style="red"))
+                console.print("[yellow]백업해 둔 설정 폴더에서 .kdf 파일을 복원한 뒤 다시 실행하세요.[/yellow]")
+                return False
+            
             # 기존 비밀번호 입력
             for attempt in range(3):
                 password = getpass.getpass("마스터 비밀번호: ")
@@ -270,18 +523,7 @@ class SSHManagerUI:
         console.print(Panel(status, title="상태"))
         console.print()
         
-        options = [
-            ("1", "서버 관리 (추가/수정/삭제)"),
-            ("2", "서버 목록 보기"),
-            ("3", "서버 연결 (명령 브로드캐스트용)"),
-            ("4", "명령 실행 (연결된 서버에)"),
-            ("5", "파일 전송 (연결된 서버에)"),
-            ("6", "연결 해제"),
-            ("7", "멀티 터미널 (분할 화면)"),
-            ("q", "종료"),
-        ]
-        
-        choice = print_menu("메인 메뉴", options)
+        choice = print_menu("메인 메뉴", MAIN_MENU_OPTIONS)
         
         if choice == "1":
             self._server_management_menu()
@@ -307,14 +549,7 @@ class SSHManagerUI:
             clear_screen()
             print_header()
             
-            options = [
-                ("1", "서버 추가"),
-                ("2", "서버 수정"),
-                ("3", "서버 삭제"),
-                ("b", "뒤로 가기"),
-            ]
-            
-            choice = print_menu("서버 관리", options)
+            choice = print_menu("서버 관리", SERVER_MENU_OPTIONS)
             
             if choice == "1":
                 self._add_server()
@@ -467,36 +702,27 @@ class SSHManagerUI:
             if not selection:
                 return
             
-            if selection.lower() == "all":
-                selected_servers = servers
-            else:
-                indices = [int(x.strip()) - 1 for x in selection.split(",")]
-                selected_servers = [servers[i] for i in indices if 0 <= i < len(servers)]
+            selected_servers = _parse_selection(selection, servers)
             
             if not selected_servers:
                 console.print("[red]선택된 서버가 없습니다.[/red]")
                 Prompt.ask("\n계속하려면 Enter를 누르세요")
                 return
             
-            # 연결 시도
+            # 연결 시도 (서버별 결과는 진행 표시 아래 표에 행으로 추가)
             console.print()
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                console=console
-            ) as progress:
-                task = progress.add_task("서버 연결 중...", total=len(selected_servers))
-                
+            results_table = _new_results_grid()
+            with self._progress_task(
+                "서버 연결 중...", total=len(selected_servers), footer=results_table
+            ) as (progress, task):
                 for server in selected_servers:
                     progress.update(task, description=f"연결 중: {server.name}")
                     success, error = self.ssh_manager.add_connection(server)
                     
                     if success:
-                        console.print(f"  [green]V[/green] {server.name}: 연결됨")
+                        results_table.add_row(_TEXT_MARK_OK, server.name, _TEXT_CONNECTED)
                     else:
-                        console.print(f"  [red]X[/red] {server.name}: {error}")
+                        results_table.add_row(_TEXT_MARK_FAIL, server.name, Text(error, style=_STYLE_FAIL))
                     
                     progress.advance(task)
             
@@ -522,6 +748,7 @@ class SSHManagerUI:
         
         if Confirm.ask("\n모든 서버 연결을 해제하시겠습니까?"):
             self.ssh_manager.disconnect_all()
+            close_cached_transports()
             console.print("[green]모든 연결이 해제되었습니다.[/green]")
         
         Prompt.ask("\n계속하려면 Enter를 누르세요")
@@ -544,11 +771,7 @@ class SSHManagerUI:
         try:
             selection = Prompt.ask("대상 서버", default="all").strip()
             
-            if selection.lower() == "all":
-                selected_ids = [s.id for s in connected]
-            else:
-                indices = [int(x.strip()) - 1 for x in selection.split(",")]
-                selected_ids = [connected[i].id for i in indices if 0 <= i < len(connected)]
+            selected_ids = [s.id for s in _parse_selection(selection, connected)]
             
             if not selected_ids:
                 console.print("[red]선택된 서버가 없습니다.[/red]")
@@ -559,39 +782,77 @@ class SSHManagerUI:
             console.print("\n[cyan]명령어를 입력하세요. 종료하려면 'exit' 또는 빈 줄 입력[/cyan]")
             console.print("[dim]화살표 위/아래: 이전 명령, Ctrl+C: 취소[/dim]")
             
-            # readline 설정 (히스토리, 자동완성)
+            self._load_command_history()
             try:
-                import readline
-                readline.parse_and_bind('tab: complete')
-                readline.parse_and_bind('set editing-mode emacs')
-            except ImportError:
-                pass  # Windows에서는 readline이 없을 수 있음
-            
-            while True:
-                try:
-                    console.print()
-                    command = input("\033[1;33m$ \033[0m").strip()
-                    
-                    if not command or command.lower() == "exit":
+                while True:
+                    try:
+                        console.print()
+                        command = input("\033[1;33m$ \033[0m").strip()
+                        
+                        if not command or command.lower() == "exit":
+                            break
+                        
+                        console.print()
+                        # 끝나는 서버부터 바로 결과 패널 출력 (진행 표시줄 위로 출력됨)
+                        with self._progress_task("실행 중...", total=len(selected_ids)) as (progress, task):
+                            for result in self.ssh_manager.execute_iter(selected_ids, command, timeout=60):
+                                console.print(build_result_panel(result), "", sep="\n")
+                                progress.advance(task)
+                    except EOFError:
                         break
-                    
-                    console.print()
-                    with console.status("[bold green]실행 중...[/bold green]"):
-                        results = self.ssh_manager.execute_on_selected(
-                            selected_ids, 
-                            command,
-                            timeout=60
-                        )
-                    
-                    print_command_results(results)
-                except EOFError:
-                    break
+            finally:
+                self._save_command_history()
             
         except KeyboardInterrupt:
             console.print("\n[yellow]취소되었습니다.[/yellow]")
         
         Prompt.ask("\n계속하려면 Enter를 누르세요")
     
+    def _history_path(self) -> str:
+        """명령 히스토리 파일 경로"""
+        return str(self.server_manager.config_dir / HISTORY_FILE_NAME)
+    
+    def _load_command_history(self):
+        """
+        저장된 명령 히스토리를 readline에 불러오기
+        
+        구현 방식:
+        - 메뉴 입력 등 이전 input() 기록은 지우고 명령 히스토리만 남김
+        - 파일이 없거나 읽을 수 없으면 빈 히스토리로 시작
+        """
+        if not _HAS_READLINE:
+            return
+        
+        readline.clear_history()
+        try:
+            readline.read_history_file(self._history_path())
+        except OSError:
+            pass
+    
+    def _save_command_history(self):
+        """
+        입력한 명령 히스토리를 파일에 저장하고 readline 히스토리 비우기
+        
+        구현 방식:
+        - 명령에 비밀번호/토큰이 들어갈 수 있으므로 servers.json과 같이 소유자 전용(0600)으로 유지
+        - 파일을 먼저 0600으로 만들어 두고, readline 구현에 따라 umask 권한으로
+          다시 만들어질 수 있으므로 쓴 뒤에도 권한을 맞춤
+        """
+        if not _HAS_READLINE:
+            return
+        
+        path = self._history_path()
+        try:
+            try:
+                write_private_file(Path(path), b'', exclusive=True)
+            except FileExistsError:
+                pass
+            readline.write_history_file(path)
+            os.chmod(path, 0o600)
+        except OSError:
+            pass
+        readline.clear_history()
+    
     def _file_transfer_menu(self):
         """파일 전송 메뉴"""
         connected = self.ssh_manager.connected_servers
@@ -604,14 +865,7 @@ class SSHManagerUI:
         print_header()
         print_servers_table(connected, show_index=True, title="연결된 서버")
         
-        options = [
-            ("1", "파일/폴더 업로드 (로컬 -> 원격)"),
-            ("2", "파일 다운로드 (단일 서버)"),
-            ("3", "폴더 다운로드 (여러 서버 -> IP별 zip)"),
-            ("b", "뒤로 가기"),
-        ]
-        
-        choice = print_menu("파일 전송", options)
+        choice = print_menu("파일 전송", TRANSFER_MENU_OPTIONS)
         
         if choice == "1":
             self._upload_file(connected)
@@ -627,11 +881,7 @@ class SSHManagerUI:
         try:
             selection = Prompt.ask("대상 서버", default="all").strip()
             
-            if selection.lower() == "all":
-                selected_servers = servers
-            else:
-                indices = [int(x.strip()) - 1 for x in selection.split(",")]
-                selected_servers = [servers[i] for i in indices if 0 <= i < len(servers)]
+            selected_servers = _parse_selection(selection, servers)
             
             if not selected_servers:
                 console.print("[red]선택된 서버가 없습니다.[/red]")
@@ -642,19 +892,13 @@ class SSHManagerUI:
             
             console.print(f"\n[cyan]{len(selected_servers)}개 서버에 파일 전송 시작...[/cyan]\n")
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task("전송 중...", total=len(selected_servers))
-                
+            # 진행 중에는 서버별 개수만 표시하고 파일별 결과는 끝난 뒤 표로 출력
+            tally = _UploadTally(selected_servers)
+            with self._progress_task(
+                "전송 중...", total=len(selected_servers), footer=tally
+            ) as (progress, task):
                 def on_result(result: TransferResult):
-                    status = "[green]성공[/green]" if result.success else f"[red]실패: {result.error_message}[/red]"
-                    console.print(f"  {result.server.name}: {status}")
+                    tally.add(result)
                     progress.advance(task)
                 
                 results = self.file_transfer.upload_to_servers(
@@ -689,15 +933,7 @@ class SSHManagerUI:
             
             console.print(f"\n[cyan]{server.name}에서 파일 다운로드 중...[/cyan]\n")
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                console=console
-            ) as progress:
-                task = progress.add_task("다운로드 중...", total=100)
-                
+            with self._progress_task("다운로드 중...", total=100) as (progress, task):
                 def on_progress(p: TransferProgress):
                     progress.update(task, completed=p.percentage)
                 
@@ -730,11 +966,7 @@ class SSHManagerUI:
         try:
             selection = Prompt.ask("대상 서버", default="all").strip()
             
-            if selection.lower() == "all":
-                selected_servers = servers
-            else:
-                indices = [int(x.strip()) - 1 for x in selection.split(",")]
-                selected_servers = [servers[i] for i in indices if 0 <= i < len(servers)]
+            selected_servers = _parse_selection(selection, servers)
             
             if not selected_servers:
                 console.print("[red]선택된 서버가 없습니다.[/red]")
@@ -750,16 +982,7 @@ class SSHManagerUI:
             console.print(f"\n[cyan]{len(selected_servers)}개 서버에서 '{folder_name}' 폴더 다운로드 중...[/cyan]")
             console.print(f"[dim]저장 위치: {local_dir}/{folder_name}_<IP>.zip[/dim]\n")
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task("다운로드 중...", total=len(selected_servers))
-                
+            with self._progress_task("다운로드 중...", total=len(selected_servers)) as (progress, task):
                 def on_result(result: TransferResult):
                     if result.success:
                         console.print(f"  [green]V[/green] {result.server.name}: {result.local_path}")
@@ -792,6 +1015,9 @@ class SSHManagerUI:
     
     def _multi_terminal(self):
         """멀티 터미널 (분할 화면) - 여러 SSH 세션을 동시에 표시"""
+        # textual/asyncssh 로딩이 무거워 이 메뉴를 열 때만 가져옴
+        from .multi_terminal import launch_multi_terminal, check_dependencies
+        
         servers = self.server_manager.list_servers()
         if not servers:
             console.print("[yellow]등록된 서버가 없습니다.[/yellow]")
@@ -822,11 +1048,7 @@ class SSHManagerUI:
             if not selection:
                 return
             
-            if selection.lower() == "all":
-                selected_servers = servers
-            else:
-                indices = [int(x.strip()) - 1 for x in selection.split(",")]
-                selected_servers = [servers[i] for i in indices if 0 <= i < len(servers)]
+            selected_servers = _parse_selection(selection, servers)
             
             if not selected_servers:
                 console.print("[red]선택된 서버가 없습니다.[/red]")